@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "config.api"
+
+    def ready(self):
+        # Connect the cache invalidation receivers.
+        from config.api import authentication, cache  # noqa: F401
+        from config.libs.db.connections import log_database_profiles
+
+        log_database_profiles(settings.DATABASES)
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_PREFIX = "auth:user:"
+USER_CACHE_TIMEOUT = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60)
+
+# For endpoints that only need the id/claims of the caller: builds a TokenUser
+# from the token and never touches the database.
+TokenUserAuthentication = JWTStatelessUserAuthentication
+
+
+def get_user_cache_key(user_id):
+    return f"{USER_CACHE_PREFIX}{user_id}"
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the user from a short-TTL cache entry,
+    dropped whenever the user row is saved or deleted.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            return super().get_user(validated_token)
+
+        key = get_user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+            return user
+
+        # Same checks super().get_user() runs after loading the row.
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            from rest_framework_simplejwt.utils import get_md5_hash_password
+
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    "The user's password has been changed.", code="password_changed"
+                )
+        return user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    cache.delete(get_user_cache_key(user_id))
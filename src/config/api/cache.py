@@ -0,0 +1,117 @@
+import hashlib
+from functools import partial, wraps
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+from config.libs.cache import tagged
+from config.libs.db.models import BaseModel
+from config.libs.db.signals import rows_changed
+
+RESPONSE_CACHE_NAMESPACE = "response"
+
+
+def invalidate_model(model):
+    tagged.invalidate_tag(tagged.model_tag(model))
+
+
+def get_response_cache_key(request, depends_on):
+    user = getattr(request, "user", None)
+    scope = f"user:{user.pk}" if user is not None and user.is_authenticated else "anon"
+    query = "&".join(
+        f"{key}={value}"
+        for key, values in sorted(request.query_params.lists())
+        for value in sorted(values)
+        if value != ""
+    )
+    raw = "|".join(
+        [
+            request.path,
+            query,
+            scope,
+            str(getattr(request, "version", None)),
+            request.accepted_renderer.format,
+        ]
+    )
+    return tagged.make_key(
+        RESPONSE_CACHE_NAMESPACE,
+        hashlib.sha1(raw.encode()).hexdigest(),
+        tags=[tagged.model_tag(model) for model in depends_on],
+    )
+
+
+def get_cached_response(view, request, get_response, timeout, depends_on):
+    if request.method not in ("GET", "HEAD"):
+        return get_response()
+
+    key = get_response_cache_key(request, depends_on)
+    cached = cache.get(key)
+    if cached is not None:
+        content, content_type = cached
+        return HttpResponse(content, content_type=content_type)
+
+    response = get_response()
+    if response.status_code != 200:
+        return response
+    response = view.finalize_response(request, response)
+    response.render()
+    cache.set(key, (response.content, response["Content-Type"]), timeout)
+    return response
+
+
+def cache_response(timeout=60, depends_on=()):
+    """
+    Cache the rendered bytes of a DRF view method's successful GET responses.
+
+    The key covers path, normalized query params, auth scope, API version and
+    renderer. Saving or deleting any model in ``depends_on`` bumps its tag and
+    so changes the key of every response depending on it.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            return get_cached_response(
+                self,
+                request,
+                partial(method, self, request, *args, **kwargs),
+                timeout,
+                depends_on,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class CachedResponseMixin:
+    """
+    ``cache_response`` for ``get``, configured with ``cache_timeout`` and
+    ``cache_depends_on`` on the view.
+    """
+
+    cache_timeout = 60
+    cache_depends_on = ()
+
+    def get(self, request, *args, **kwargs):
+        return get_cached_response(
+            self,
+            request,
+            partial(super().get, request, *args, **kwargs),
+            self.cache_timeout,
+            self.cache_depends_on,
+        )
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_on_change(sender, **kwargs):
+    if issubclass(sender, BaseModel):
+        invalidate_model(sender)
+
+
+@receiver(rows_changed)
+def invalidate_on_bulk_change(sender, **kwargs):
+    invalidate_model(sender)
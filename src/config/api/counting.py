@@ -0,0 +1,128 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from config.libs.cache import tagged
+
+COUNT_CACHE_NAMESPACE = "pagination_count"
+
+
+def get_queryset_fingerprint(queryset):
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    raw = f"{queryset.db}:{sql}:{params!r}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def get_estimated_count(queryset):
+    """
+    Planner row estimate for the queryset, only available on PostgreSQL.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedPage(Page):
+    """
+    Page whose ``has_next`` comes from the rows actually fetched, not from an
+    estimated count.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def end_index(self):
+        return self.start_index() + len(self) - 1
+
+
+class CountingPaginator(Paginator):
+    """
+    Paginator whose count is served from the cache and, for large querysets,
+    from the planner estimate instead of a full COUNT(*).
+    An estimated count is only reported; which pages exist is decided by the
+    rows actually fetched (``per_page + 1`` of them).
+    """
+
+    count_cache_timeout = getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 60)
+    estimate_threshold = getattr(settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", 100_000)
+
+    is_approximate_count = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            return super().count
+
+        fingerprint = get_queryset_fingerprint(self.object_list)
+        if fingerprint is None:
+            return 0
+
+        tags = [tagged.model_tag(self.object_list.model)]
+        cached = tagged.get_value(COUNT_CACHE_NAMESPACE, fingerprint, tags=tags)
+        if cached is not None:
+            count, self.is_approximate_count = cached
+            return count
+
+        count = None
+        if self.estimate_threshold:
+            estimate = get_estimated_count(self.object_list)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                count, self.is_approximate_count = estimate, True
+        if count is None:
+            count = self.object_list.count()
+
+        tagged.set_value(
+            COUNT_CACHE_NAMESPACE,
+            fingerprint,
+            (count, self.is_approximate_count),
+            self.count_cache_timeout,
+            tags=tags,
+        )
+        return count
+
+    def validate_number(self, number):
+        if not (self.count and self.is_approximate_count):
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_approximate_count:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(
+            rows[: self.per_page], number, self, has_next=len(rows) > self.per_page
+        )
@@ -29,6 +29,10 @@ class ResponseMessage(Enum):
     # Authentication
     AUTH_WRONG_PASSWORD = "کلمه عبور اشتباه میباشد"
     AUTH_WRONG_OTP = "کد تایید اشتباه میباشد"
+    AUTH_OTP_EXPIRED = "کد تایید منقضی شده است"
+    AUTH_OTP_ALREADY_SENT = "کد تایید قبلا ارسال شده است، لطفا کمی صبر کنید"
+    AUTH_OTP_TOO_MANY_REQUESTS = "تعداد درخواست های کد تایید بیش از حد مجاز است"
+    AUTH_OTP_TOO_MANY_ATTEMPTS = "تعداد تلاش های ناموفق بیش از حد مجاز است"
     AUTH_LOGIN_SUCCESSFULLY = "با موفقیت وارد شدید"
     AUTH_LOGOUT_SUCCESSFULLY = "با موفقیت خارج شدید"
 
@@ -0,0 +1,49 @@
+import timeit
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from config.api.enums import ResponseMessage
+from config.api.renderers import BaseResponseJSONRenderer, orjson
+
+
+class Command(BaseCommand):
+    help = "Compare BaseResponseJSONRenderer against DRF's default JSONRenderer"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--number", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rows = [
+            {
+                "id": i,
+                "uuid": uuid.uuid4(),
+                "title": f"محصول شماره {i}",
+                "price": Decimal("125000.00"),
+                "created_at": datetime.now(timezone.utc),
+                "tags": ["a", "b", "c"],
+            }
+            for i in range(options["rows"])
+        ]
+        data = {
+            "success": True,
+            "status": 200,
+            "message": ResponseMessage.SUCCESS.value,
+            "data": {"entity_count": len(rows), "data": rows},
+        }
+
+        self.stdout.write(f"orjson available: {orjson is not None}")
+        results = {}
+        for renderer in (JSONRenderer(), BaseResponseJSONRenderer()):
+            name = type(renderer).__name__
+            seconds = timeit.timeit(lambda: renderer.render(data), number=options["number"])
+            results[name] = seconds
+            self.stdout.write(
+                f"{name}: {seconds / options['number'] * 1_000_000:.1f} us/render"
+            )
+        speedup = results["JSONRenderer"] / results["BaseResponseJSONRenderer"]
+        self.stdout.write(f"speedup: {speedup:.2f}x\n")
@@ -0,0 +1,46 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.throttling import ScopedRateThrottle
+
+from config.api.throttling import SlidingWindowScopedRateThrottle
+
+
+class Command(BaseCommand):
+    help = "Compare ScopedRateThrottle and SlidingWindowScopedRateThrottle under concurrent load"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20000)
+        parser.add_argument("--clients", type=int, default=200)
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--scope", default="30perminute")
+
+    def handle(self, *args, **options):
+        view = SimpleNamespace(throttle_scope=options["scope"])
+        factory = RequestFactory()
+        requests = []
+        for i in range(options["requests"]):
+            client = i % options["clients"]
+            request = factory.get(
+                "/",
+                REMOTE_ADDR=f"10.{client >> 16 & 255}.{client >> 8 & 255}.{client & 255}",
+            )
+            request.user = AnonymousUser()
+            requests.append(request)
+
+        for throttle_class in (ScopedRateThrottle, SlidingWindowScopedRateThrottle):
+            def check(request):
+                return throttle_class().allow_request(request, view)
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+                allowed = sum(executor.map(check, requests))
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{throttle_class.__name__}: {options['requests'] / elapsed:.0f} req/s, "
+                f"{allowed} allowed"
+            )
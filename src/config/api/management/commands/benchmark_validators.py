@@ -0,0 +1,49 @@
+import re
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from config.libs.validator import validators
+
+
+def legacy_validate_username(username):
+    is_email = re.match(validators.email_regex, username)
+    is_phone = re.match(validators.phone_regex, username)
+    return True if (is_email or is_phone) else False
+
+
+def legacy_validate_password(password):
+    if len(password) < 6 or len(password) > 18:
+        return False
+    if not re.search(r"[A-Z]", password):
+        return False
+    if not re.search(r"[a-z]", password):
+        return False
+    if not re.search(r"\d", password):
+        return False
+    return True
+
+
+class Command(BaseCommand):
+    help = "Compare the precompiled validators against the raw re.match versions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=20)
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        usernames = [f"09{i:09d}" for i in range(5000)] + [
+            f"User{i}@Example.com" for i in range(5000)
+        ]
+        passwords = [f"secretPass{i % 100}" for i in range(10000)]
+
+        cases = (
+            ("username legacy", lambda: [legacy_validate_username(u) for u in usernames]),
+            ("username compiled", lambda: [validators.validate_username(u) for u in usernames]),
+            ("validate_many", lambda: validators.validate_many(usernames)),
+            ("password legacy", lambda: [legacy_validate_password(p) for p in passwords]),
+            ("password single pass", lambda: [validators.validate_password(p) for p in passwords]),
+        )
+        for name, func in cases:
+            seconds = timeit.timeit(func, number=number) / number
+            self.stdout.write(f"{name}: {seconds * 1000:.2f} ms / 10k items")
@@ -0,0 +1,50 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections, router
+from django.db.models import ForeignKey
+
+from config.libs.db.models import BaseModel, get_live_index_name
+
+
+class Command(BaseCommand):
+    help = "Report BaseModel tables missing their partial (is_deleted = false) indexes"
+
+    def handle(self, *args, **options):
+        missing_total = 0
+        for model in apps.get_models():
+            if not issubclass(model, BaseModel):
+                continue
+
+            connection = connections[router.db_for_read(model)]
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+
+            missing = [
+                field_name
+                for field_name in model.live_index_fields
+                if get_live_index_name(model, field_name) not in constraints
+            ]
+            undeclared = [
+                field.name
+                for field in model._meta.concrete_fields
+                if (isinstance(field, ForeignKey) or field.db_index)
+                and field.name not in model.live_index_fields
+            ]
+
+            label = model._meta.label
+            if missing:
+                missing_total += len(missing)
+                self.stdout.write(
+                    f"{label}: missing live indexes on {', '.join(missing)} "
+                    f"(run makemigrations/migrate)"
+                )
+            if undeclared:
+                self.stdout.write(
+                    f"{label}: indexed fields without a live index: {', '.join(undeclared)}"
+                )
+            if not missing and not undeclared:
+                self.stdout.write(f"{label}: ok")
+
+        self.stdout.write(f"{missing_total} missing live indexes\n")
@@ -1,8 +1,25 @@
 from django.core.cache import cache
 from django.core.management.base import BaseCommand
 
+from config.libs.cache import tagged
+
 
 class Command(BaseCommand):
+    help = "Invalidate cache namespaces/tags, or clear the whole cache when none is given"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--namespace", action="append", default=[])
+        parser.add_argument("--tag", action="append", default=[])
+
     def handle(self, *args, **kwargs):
-        cache.clear()
-        self.stdout.write("Cache is cleared\n")
+        if not kwargs["namespace"] and not kwargs["tag"]:
+            cache.clear()
+            self.stdout.write("Cache is cleared\n")
+            return
+
+        for namespace in kwargs["namespace"]:
+            generation = tagged.invalidate_namespace(namespace)
+            self.stdout.write(f"Namespace {namespace} invalidated (generation {generation})\n")
+        for tag in kwargs["tag"]:
+            generation = tagged.invalidate_tag(tag)
+            self.stdout.write(f"Tag {tag} invalidated (generation {generation})\n")
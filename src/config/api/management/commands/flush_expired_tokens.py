@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted JWTs in chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--sleep", type=float, default=0.2, help="Seconds to wait between batches"
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by("id")
+        outstanding = blacklisted = 0
+        while True:
+            ids = list(expired.values_list("id", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            with transaction.atomic():
+                blacklisted += BlacklistedToken.objects.filter(
+                    token_id__in=ids
+                ).delete()[0]
+                outstanding += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+            if len(ids) < options["batch_size"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(
+            f"Deleted {outstanding} outstanding and {blacklisted} blacklisted tokens\n"
+        )
@@ -0,0 +1,146 @@
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import CASCADE, PROTECT, RESTRICT, Exists, OuterRef, Q
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+from config.libs.db.models import BaseModel
+
+
+def get_blocking_children(model, cutoff, seen=None):
+    """
+    Q matching rows of ``model`` that cannot be hard-deleted: rows with a
+    CASCADE descendant that must survive (any live or recently deleted
+    BaseModel row, or any non-BaseModel row) and rows still referenced through
+    PROTECT or RESTRICT, which would make the delete raise.
+    """
+    seen = (seen or set()) | {model}
+    condition = None
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or relation.on_delete not in (
+            CASCADE,
+            PROTECT,
+            RESTRICT,
+        ):
+            continue
+        child = relation.related_model
+        children = child._base_manager.filter(
+            **{relation.field.name: OuterRef("pk")}
+        )
+        if relation.on_delete is CASCADE and issubclass(child, BaseModel):
+            keep = ~Q(is_deleted=True, deleted_at__lt=cutoff)
+            if child not in seen:
+                nested = get_blocking_children(child, cutoff, seen)
+                if nested is not None:
+                    keep |= nested
+            children = children.filter(keep)
+        exists = Q(Exists(children))
+        condition = exists if condition is None else condition | exists
+    return condition
+
+
+def count_cascade(queryset):
+    """
+    Rows per model that ``queryset.delete()`` would remove.
+    """
+    collector = Collector(using=queryset.db, origin=queryset)
+    collector.collect(queryset)
+    counts = Counter()
+    for model, instances in collector.data.items():
+        counts[model._meta.label] += len(instances)
+    for fast_delete in collector.fast_deletes:
+        counts[fast_delete.model._meta.label] += fast_delete.count()
+    return counts
+
+
+class Command(BaseCommand):
+    help = "Hard-delete soft-deleted BaseModel rows older than the retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "SOFT_DELETE_RETENTION_DAYS", 30),
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="app_label.ModelName, can be repeated. Defaults to every BaseModel.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep", type=float, default=0.5, help="Seconds to wait between batches"
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def get_models(self, labels):
+        if not labels:
+            return [m for m in apps.get_models() if issubclass(m, BaseModel)]
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            if not issubclass(model, BaseModel):
+                raise CommandError(f"{label} is not a BaseModel")
+            models.append(model)
+        return models
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        dry_run = options["dry_run"]
+        totals = Counter()
+        for model in self.get_models(options["models"]):
+            # _base_manager is not filtered on is_deleted=False like objects is.
+            expired = model._base_manager.filter(
+                is_deleted=True, deleted_at__lt=cutoff
+            )
+            blocking = get_blocking_children(model, cutoff)
+            if blocking is not None:
+                expired = expired.exclude(blocking)
+            label = model._meta.label
+
+            started = time.monotonic()
+            per_model = Counter()
+            batches = 0
+            last_pk = None
+            while True:
+                chunk = expired.order_by("pk")
+                if last_pk is not None:
+                    chunk = chunk.filter(pk__gt=last_pk)
+                pks = list(chunk.values_list("pk", flat=True)[: options["batch_size"]])
+                if not pks:
+                    break
+                batch = model._base_manager.filter(pk__in=pks)
+                if dry_run:
+                    per_model.update(count_cascade(batch))
+                else:
+                    with transaction.atomic(using=expired.db):
+                        per_model.update(batch.delete()[1])
+                batches += 1
+                last_pk = pks[-1]
+                if len(pks) < options["batch_size"]:
+                    break
+                if not dry_run:
+                    time.sleep(options["sleep"])
+
+            totals.update(per_model)
+            verb = "would purge" if dry_run else "purged"
+            self.stdout.write(
+                f"{label}: {verb} {sum(per_model.values())} rows in {batches} batches "
+                f"({time.monotonic() - started:.1f}s)"
+            )
+            for name, count in sorted(per_model.items()):
+                if count:
+                    self.stdout.write(f"  {name}: {count}")
+
+        verb = "would be purged" if dry_run else "purged"
+        self.stdout.write(f"{sum(totals.values())} rows {verb}\n")
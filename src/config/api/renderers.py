@@ -0,0 +1,98 @@
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from config.api.enums import ResponseMessage
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ENVELOPE_KEYS = ("success", "status", "message", "data")
+
+_drf_encoder = JSONEncoder()
+
+
+def _escape_line_separators(content) -> bytes:
+    # Same as DRF: U+2028/U+2029 are valid JSON but not valid in JavaScript strings.
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+def _stdlib_dumps(data) -> bytes:
+    return _escape_line_separators(
+        json.dumps(
+            data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    )
+
+
+if orjson is not None:
+    _orjson_options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data) -> bytes:
+        try:
+            content = orjson.dumps(
+                data, default=_drf_encoder.default, option=_orjson_options
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the stdlib handles.
+            return _stdlib_dumps(data)
+        return _escape_line_separators(content)
+
+else:
+    dumps = _stdlib_dumps
+
+
+ENCODED_MESSAGES = {member.value: dumps(member.value) for member in ResponseMessage}
+_envelope_prefixes = {}
+
+
+def get_envelope_prefix(success, status, message) -> bytes:
+    key = (success, status, message)
+    prefix = _envelope_prefixes.get(key)
+    if prefix is None:
+        encoded_message = ENCODED_MESSAGES.get(message) or dumps(message)
+        prefix = b'{"success":%s,"status":%s,"message":%s,"data":' % (
+            b"true" if success else b"false",
+            dumps(status),
+            encoded_message,
+        )
+        # Only static ResponseMessage values are kept, formatted ones vary per call.
+        if message is None or message in ENCODED_MESSAGES:
+            _envelope_prefixes[key] = prefix
+    return prefix
+
+
+class BaseResponseJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that uses orjson when installed and reuses pre-encoded
+    bytes for the static parts of the BaseResponse envelope.
+    """
+
+    @staticmethod
+    def is_envelope(data) -> bool:
+        return (
+            isinstance(data, dict)
+            and tuple(data) == ENVELOPE_KEYS
+            and isinstance(data["success"], bool)
+            and isinstance(data["status"], int)
+            and (data["message"] is None or isinstance(data["message"], str))
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.is_envelope(data):
+            prefix = get_envelope_prefix(data["success"], data["status"], data["message"])
+            return prefix + dumps(data["data"]) + b"}"
+
+        return dumps(data)
@@ -1,7 +1,14 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
+from config.api.counting import CountingPaginator
 from config.api.enums import ResponseMessage
 
 
@@ -16,19 +23,80 @@ class BaseResponse(Response):
         super().__init__(response_data)
 
 
+class StreamingBaseResponse(StreamingHttpResponse):
+    """
+    BaseResponse envelope written incrementally from a queryset iterator,
+    so the full ``data`` list is never held in memory.
+    Serves both WSGI (``__iter__``) and ASGI (``__aiter__``): under ASGI each
+    chunk of ``chunk_size`` rows is fetched and serialized in a sync thread.
+    """
+
+    def __init__(
+            self,
+            queryset,
+            serializer_class=None,
+            message: str = None,
+            status: int = status.HTTP_200_OK,
+            chunk_size: int = 2000,
+    ):
+        self.serializer_class = serializer_class
+        self.chunk_size = chunk_size
+        head = json.dumps(
+            {
+                "success": True if status // 100 == 2 else False,
+                "status": status,
+                "message": message,
+            },
+            ensure_ascii=False,
+        )
+        self.head = f'{head[:-1]}, "data": ['.encode()
+        super().__init__(
+            self.stream(queryset), status=status, content_type="application/json"
+        )
+
+    def encode(self, obj) -> bytes:
+        if self.serializer_class is not None:
+            obj = self.serializer_class(obj).data
+        return json.dumps(obj, cls=JSONEncoder, ensure_ascii=False).encode()
+
+    def stream(self, queryset):
+        yield self.head
+        iterator = (
+            queryset.iterator(chunk_size=self.chunk_size)
+            if hasattr(queryset, "iterator")
+            else iter(queryset)
+        )
+        separator = b""
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield separator + b",".join(self.encode(obj) for obj in chunk)
+            separator = b","
+        yield b"]}"
+
+    async def __aiter__(self):
+        content = self.streaming_content
+        get_next = sync_to_async(next)
+        while (part := await get_next(content, None)) is not None:
+            yield part
+
+
 class PaginationApiResponse(PageNumberPagination):
     page_size_query_param = "take"
     page_query_param = "page"
     page_size = 20
     max_page_size = 20
+    django_paginator_class = CountingPaginator
 
     def get_paginated_response(self, data) -> BaseResponse:
         current_page = self.page.number
-        page_count = self.page.paginator.num_pages
+        # An estimated count can undershoot the pages that actually exist.
+        page_count = max(
+            self.page.paginator.num_pages, current_page + self.page.has_next()
+        )
         pagination = {
             "entity_count": self.page.paginator.count,
+            "entity_count_is_approximate": self.page.paginator.is_approximate_count,
             "current_page": self.page.number,
-            "page_count": self.page.paginator.num_pages,
+            "page_count": page_count,
             "start_page": max(current_page - 2, 1),
             "end_page": min(current_page + 2, page_count),
             "take": self.page.paginator.per_page,
@@ -45,3 +113,32 @@ class PaginationApiResponse(PageNumberPagination):
     def __call__(self, request, queryset):
         paginator = super().__call__(request, queryset)
         return self.get_paginated_response(paginator.page)
+
+
+class CursorPaginationApiResponse(CursorPagination):
+    """
+    Keyset pagination over the auto-increment primary key: unique, indexed and
+    in insertion order.
+    Skips COUNT(*) and OFFSET scans; clients follow the opaque next/previous cursors.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "take"
+    page_size = 20
+    max_page_size = 20
+    ordering = "-pk"
+
+    def get_paginated_response(self, data) -> BaseResponse:
+        pagination = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "take": self.page_size,
+            "has_next": self.has_next,
+            "has_previous": self.has_previous,
+            "data": data,
+        }
+        return BaseResponse(
+            data=pagination,
+            status=status.HTTP_200_OK,
+            message=ResponseMessage.SUCCESS.value,
+        )
@@ -0,0 +1,250 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.core.paginator import EmptyPage
+from django.db import connection, models
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from config.api.counting import CountingPaginator
+from config.api.renderers import BaseResponseJSONRenderer, _stdlib_dumps
+from config.api.response import StreamingBaseResponse
+from config.api.tokens import BlacklistFilter
+from config.api.throttling import SlidingWindowScopedRateThrottle
+from config.libs.db.models import BaseModel
+
+
+class PurgeParent(BaseModel):
+    class Meta:
+        app_label = "api"
+
+
+class PurgeChild(BaseModel):
+    parent = models.ForeignKey(PurgeParent, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "api"
+
+
+class PurgeGuard(models.Model):
+    parent = models.ForeignKey(PurgeParent, on_delete=models.PROTECT)
+
+    class Meta:
+        app_label = "api"
+
+
+class PurgeSoftDeletedTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            editor.create_model(PurgeParent)
+            editor.create_model(PurgeChild)
+            editor.create_model(PurgeGuard)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            editor.delete_model(PurgeGuard)
+            editor.delete_model(PurgeChild)
+            editor.delete_model(PurgeParent)
+
+    def setUp(self):
+        old = timezone.now() - timedelta(days=60)
+        for _ in range(5):
+            parent = PurgeParent.objects.create()
+            PurgeChild.objects.create(parent=parent)
+        self.purgeable = PurgeParent.objects.create()
+        PurgeChild.objects.create(parent=self.purgeable)
+        PurgeParent._base_manager.update(is_deleted=True, deleted_at=old)
+        PurgeChild._base_manager.filter(parent=self.purgeable).update(
+            is_deleted=True, deleted_at=old
+        )
+
+    def purge(self, *args):
+        out = StringIO()
+        call_command(
+            "purge_soft_deleted",
+            "--model=api.PurgeParent",
+            "--days=30",
+            "--sleep=0",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_parents_with_live_children_are_kept(self):
+        output = self.purge()
+        self.assertEqual(PurgeChild.objects.count(), 5)
+        self.assertEqual(PurgeParent._base_manager.count(), 5)
+        self.assertFalse(
+            PurgeParent._base_manager.filter(pk=self.purgeable.pk).exists()
+        )
+        self.assertIn("api.PurgeChild: 1", output)
+        self.assertIn("2 rows purged", output)
+
+    def test_dry_run_reports_cascaded_rows(self):
+        output = self.purge("--dry-run")
+        self.assertEqual(PurgeParent._base_manager.count(), 6)
+        self.assertIn("api.PurgeChild: 1", output)
+        self.assertIn("2 rows would be purged", output)
+
+    def test_protected_parents_are_skipped(self):
+        old = timezone.now() - timedelta(days=60)
+        guarded = PurgeParent.objects.create()
+        PurgeGuard.objects.create(parent=guarded)
+        PurgeParent._base_manager.filter(pk=guarded.pk).update(
+            is_deleted=True, deleted_at=old
+        )
+        self.assertIn("2 rows would be purged", self.purge("--dry-run"))
+        output = self.purge()
+        self.assertTrue(PurgeParent._base_manager.filter(pk=guarded.pk).exists())
+        self.assertFalse(
+            PurgeParent._base_manager.filter(pk=self.purgeable.pk).exists()
+        )
+        self.assertIn("2 rows purged", output)
+
+
+class SlidingWindowThrottleTests(SimpleTestCase):
+    def setUp(self):
+        self.now = 60 * 16_667.0  # start of a minute window
+        self.cache = LocMemCache("throttle-tests", {})
+        self.cache.clear()
+        self.request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1")
+        self.request.user = AnonymousUser()
+        self.view = type("View", (), {"throttle_scope": "2perminute"})()
+        SlidingWindowScopedRateThrottle.finished_windows.clear()
+
+    def allow(self):
+        throttle = SlidingWindowScopedRateThrottle()
+        throttle.cache = self.cache
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(self.request, self.view)
+
+    def test_limit_is_enforced(self):
+        self.assertEqual([self.allow() for _ in range(3)], [True, True, False])
+
+    def retry(self, scope, seconds, every):
+        self.view.throttle_scope = scope
+        allowed = 0
+        for _ in range(seconds // every):
+            allowed += self.allow()
+            self.now += every
+        return allowed
+
+    def test_rejected_requests_do_not_count(self):
+        self.assertEqual(self.retry("2perminute", 5 * 60, 10), 10)
+
+    def test_steady_retries_get_the_configured_rate(self):
+        self.assertEqual(self.retry("1perminute", 10 * 60, 1), 10)
+        self.assertEqual(self.retry("5perminute", 10 * 60, 1), 50)
+
+
+class StreamingBaseResponseTests(TestCase):
+    def get_response(self):
+        return StreamingBaseResponse(
+            ContentType.objects.values("app_label", "model").order_by("pk"),
+            message="ok",
+            chunk_size=3,
+        )
+
+    def expected(self):
+        return list(ContentType.objects.values("app_label", "model").order_by("pk"))
+
+    def test_streams_synchronously(self):
+        body = json.loads(b"".join(self.get_response()))
+        self.assertEqual(body["message"], "ok")
+        self.assertEqual(body["data"], self.expected())
+
+    async def test_streams_asynchronously(self):
+        response = self.get_response()
+        parts = [part async for part in response]
+        expected = await ContentType.objects.values("app_label", "model").order_by(
+            "pk"
+        ).acount()
+        self.assertGreater(len(parts), 2)
+        self.assertEqual(len(json.loads(b"".join(parts))["data"]), expected)
+
+
+class BaseResponseJSONRendererTests(SimpleTestCase):
+    def render(self, data):
+        return BaseResponseJSONRenderer().render(
+            {"success": True, "status": 200, "message": None, "data": data}
+        )
+
+    def test_big_integers_fall_back_to_stdlib(self):
+        self.assertEqual(json.loads(self.render(2**70))["data"], 2**70)
+
+    def test_line_separators_are_escaped(self):
+        for content in (self.render("a\u2028b\u2029c"), _stdlib_dumps("a\u2028b")):
+            self.assertNotIn("\u2028".encode(), content)
+            self.assertIn(b"\\u2028", content)
+        self.assertEqual(json.loads(self.render("a\u2028b"))["data"], "a\u2028b")
+
+
+class BlacklistFilterTests(TestCase):
+    def blacklist(self, row_id):
+        token = OutstandingToken.objects.create(
+            jti=f"jti-{row_id}",
+            token="token",
+            expires_at=timezone.now() + timedelta(days=1),
+        )
+        BlacklistedToken.objects.create(id=row_id, token=token)
+
+    def test_rows_committed_out_of_id_order_are_picked_up(self):
+        blacklist_filter = BlacklistFilter(overlap=60)
+        now = [0.0]
+        with mock.patch("config.api.tokens.time.monotonic", lambda: now[0]):
+            self.blacklist(10)
+            blacklist_filter.rebuild()
+            for row_id in (12, 11, 14, 13):
+                now[0] += 31
+                # 11 and 13 commit after a higher id has already been read.
+                self.blacklist(row_id)
+                blacklist_filter.refresh()
+                self.assertIn(f"jti-{row_id}", blacklist_filter.filter)
+
+
+class CountingPaginatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.queryset = ContentType.objects.order_by("pk")
+        self.total = self.queryset.count()
+
+    def paginator(self, estimate):
+        paginator = CountingPaginator(self.queryset, 2)
+        paginator.estimate_threshold = 1
+        patcher = mock.patch(
+            "config.api.counting.get_estimated_count", return_value=estimate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return paginator
+
+    def test_low_estimate_does_not_hide_pages(self):
+        paginator = self.paginator(estimate=1)
+        last = (self.total + 1) // 2
+        page = paginator.page(last)
+        self.assertTrue(paginator.is_approximate_count)
+        self.assertEqual(page.object_list, list(self.queryset)[(last - 1) * 2 :])
+        self.assertFalse(page.has_next())
+        self.assertTrue(paginator.page(last - 1).has_next())
+
+    def test_high_estimate_does_not_advertise_empty_pages(self):
+        paginator = self.paginator(estimate=self.total * 10)
+        last = (self.total + 1) // 2
+        self.assertFalse(paginator.page(last).has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(last + 1)
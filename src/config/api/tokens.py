@@ -0,0 +1,154 @@
+import hashlib
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import serializers, tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+
+class BloomFilter:
+    def __init__(self, capacity, hashes=7):
+        # ~10 bits per item keeps false positives around 1% at capacity.
+        self.size = max(capacity * 10, 1024)
+        self.hashes = hashes
+        self.bits = bytearray(self.size // 8 + 1)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class BlacklistFilter:
+    """
+    Process-wide Bloom filter of blacklisted JTIs. A miss means "not
+    blacklisted" without a query; a hit is confirmed against the database.
+
+    New blacklist rows are pulled incrementally every ``refresh_interval``
+    seconds and the filter is rebuilt every ``rebuild_interval`` to drop
+    expired tokens. Tokens blacklisted by another process are therefore
+    only seen after the next refresh, provided their transaction commits
+    within ``overlap`` seconds.
+    """
+
+    def __init__(self, refresh_interval=30, rebuild_interval=3600, overlap=60):
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.overlap = overlap
+        self.lock = threading.Lock()
+        self.filter = None
+        self.last_id = 0
+        # (monotonic time a scan started, highest id known before it)
+        self.checkpoints = deque()
+        self.refreshed_at = 0
+        self.rebuilt_at = 0
+
+    def _rows(self, last_id=0):
+        return (
+            BlacklistedToken.objects.filter(
+                id__gt=last_id, token__expires_at__gt=timezone.now()
+            )
+            .order_by("id")
+            .values_list("id", "token__jti")
+            .iterator(chunk_size=5000)
+        )
+
+    def rebuild(self):
+        started = time.monotonic()
+        self.checkpoints.append((started, self.last_id))
+        capacity = BlacklistedToken.objects.filter(
+            token__expires_at__gt=timezone.now()
+        ).count()
+        bloom = BloomFilter(capacity * 2)
+        last_id = 0
+        for last_id, jti in self._rows():
+            bloom.add(jti)
+        self.filter, self.last_id = bloom, last_id
+        self.rebuilt_at = self.refreshed_at = started
+
+    def refresh(self):
+        # Sequence order is not commit order: a row can commit after one with
+        # a higher id has been read. Re-scan from the highest id known at
+        # least ``overlap`` seconds ago so such rows are still picked up.
+        started = time.monotonic()
+        checkpoints = self.checkpoints
+        while len(checkpoints) > 1 and checkpoints[1][0] <= started - self.overlap:
+            checkpoints.popleft()
+        since = 0
+        if checkpoints and checkpoints[0][0] <= started - self.overlap:
+            since = checkpoints[0][1]
+        checkpoints.append((started, self.last_id))
+        for row_id, jti in self._rows(since):
+            self.filter.add(jti)
+            self.last_id = max(self.last_id, row_id)
+        self.refreshed_at = started
+
+    def ensure_fresh(self):
+        now = time.monotonic()
+        with self.lock:
+            if self.filter is None or now - self.rebuilt_at > self.rebuild_interval:
+                self.rebuild()
+            elif now - self.refreshed_at > self.refresh_interval:
+                self.refresh()
+
+    def add(self, jti):
+        with self.lock:
+            if self.filter is not None:
+                self.filter.add(jti)
+
+    def is_blacklisted(self, jti):
+        self.ensure_fresh()
+        if jti not in self.filter:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+blacklist_filter = BlacklistFilter(
+    refresh_interval=getattr(settings, "JWT_BLACKLIST_REFRESH_INTERVAL", 30),
+    rebuild_interval=getattr(settings, "JWT_BLACKLIST_REBUILD_INTERVAL", 3600),
+    overlap=getattr(settings, "JWT_BLACKLIST_REFRESH_OVERLAP", 60),
+)
+
+
+class FilteredBlacklistMixin:
+    def check_blacklist(self):
+        if blacklist_filter.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        blacklist_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+
+class RefreshToken(FilteredBlacklistMixin, tokens.RefreshToken):
+    pass
+
+
+class TokenObtainPairSerializer(serializers.TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+
+class TokenRefreshSerializer(serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
+
+
+class TokenBlacklistSerializer(serializers.TokenBlacklistSerializer):
+    token_class = RefreshToken
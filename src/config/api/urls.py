@@ -2,6 +2,8 @@ from django.urls import include, path
 
 admin_urls = []
 
-front_urls = []
+front_urls = [
+    path("persian/", include("config.libs.persian.urls")),
+]
 
 urlpatterns = [] + admin_urls + front_urls
@@ -0,0 +1,242 @@
+import math
+import pickle
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.functional import cached_property
+
+_missing = object()
+
+
+class LocalStore:
+    """
+    Process-wide bounded LRU shared by every thread's backend instance.
+    Values are pickled, like LocMemCache, so callers can't mutate cached objects.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = Counter()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return _missing
+            pickled, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.data[key]
+                return _missing
+            self.data.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def set(self, key, value, ttl):
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.data[key] = (pickled, time.monotonic() + ttl)
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+_local_stores = {}
+_local_stores_lock = threading.Lock()
+
+
+def get_local_store(name, max_entries):
+    with _local_stores_lock:
+        if name not in _local_stores:
+            _local_stores[name] = LocalStore(max_entries)
+        return _local_stores[name]
+
+
+class TwoTierCache(BaseCache):
+    """
+    In-process LRU in front of a shared cache (``LOCATION`` is the alias of
+    the shared backend in ``CACHES``). Local entries live at most
+    ``LOCAL_TIMEOUT`` seconds, which bounds staleness between processes.
+    Keys starting with one of ``LOCAL_EXCLUDE_PREFIXES`` always go to the
+    shared tier. Writes, deletes and counters always go to the shared tier.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.remote_alias = location
+        self.local_timeout = options.get("LOCAL_TIMEOUT", 5)
+        self.local_exclude_prefixes = tuple(options.get("LOCAL_EXCLUDE_PREFIXES", ()))
+        self.local = get_local_store(location, options.get("LOCAL_MAX_ENTRIES", 1000))
+
+    @cached_property
+    def remote(self):
+        return caches[self.remote_alias]
+
+    @property
+    def stats(self):
+        return self.local.stats
+
+    def _local_key(self, key, version):
+        if key.startswith(self.local_exclude_prefixes):
+            return None
+        return self.remote.make_and_validate_key(key, version=version)
+
+    def _local_ttl(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.remote.default_timeout
+        if timeout is None:
+            return self.local_timeout
+        return min(self.local_timeout, timeout)
+
+    def get(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        if local_key is not None:
+            value = self.local.get(local_key)
+            if value is not _missing:
+                self.stats["local_hits"] += 1
+                return value
+            self.stats["local_misses"] += 1
+
+        value = self.remote.get(key, _missing, version=version)
+        if value is _missing:
+            self.stats["remote_misses"] += 1
+            return default
+        self.stats["remote_hits"] += 1
+        if local_key is not None:
+            self.local.set(local_key, value, self.local_timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.remote.set(key, value, timeout, version=version)
+        local_key = self._local_key(key, version)
+        if local_key is not None:
+            ttl = self._local_ttl(timeout)
+            if ttl > 0:
+                self.local.set(local_key, value, ttl)
+            else:
+                self.local.delete(local_key)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.remote.add(key, value, timeout, version=version)
+        if added:
+            self._drop_local(key, version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.remote.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._drop_local(key, version)
+        return self.remote.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _missing, version=version) is not _missing
+
+    def incr(self, key, delta=1, version=None):
+        value = self.remote.incr(key, delta, version=version)
+        self._drop_local(key, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remote_keys = []
+        for key in keys:
+            local_key = self._local_key(key, version)
+            value = self.local.get(local_key) if local_key is not None else _missing
+            if value is _missing:
+                remote_keys.append(key)
+            else:
+                self.stats["local_hits"] += 1
+                found[key] = value
+        if remote_keys:
+            remote_found = self.remote.get_many(remote_keys, version=version)
+            self.stats["remote_hits"] += len(remote_found)
+            self.stats["remote_misses"] += len(remote_keys) - len(remote_found)
+            for key, value in remote_found.items():
+                local_key = self._local_key(key, version)
+                if local_key is not None:
+                    self.local.set(local_key, value, self.local_timeout)
+            found.update(remote_found)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.remote.set_many(data, timeout, version=version)
+        for key in data:
+            self._drop_local(key, version)
+        return failed
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._drop_local(key, version)
+        self.remote.delete_many(keys, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.remote.clear()
+
+    def _drop_local(self, key, version):
+        local_key = self._local_key(key, version)
+        if local_key is not None:
+            self.local.delete(local_key)
+
+    def get_or_compute(
+            self,
+            key,
+            compute,
+            timeout=DEFAULT_TIMEOUT,
+            beta=1.0,
+            lock_timeout=10,
+            version=None,
+    ):
+        """
+        Stampede-safe ``get_or_set``. Entries are recomputed early with a
+        probability that grows near expiry (XFetch), and only the caller
+        holding the shared lock recomputes; others keep serving the stale
+        value or wait for the fresh one.
+        """
+        entry = self.get(key, version=version)
+        if entry is not None:
+            value, delta, expires_at = entry
+            jitter = -delta * beta * math.log(1 - random.random())
+            if time.time() + jitter < expires_at:
+                return value
+
+        lock_key = f"{key}:lock"
+        locked = self.remote.add(lock_key, 1, lock_timeout, version=version)
+        if not locked:
+            self.stats["lock_waits"] += 1
+            if entry is not None:
+                return entry[0]
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = self.remote.get(key, version=version)
+                if entry is not None:
+                    return entry[0]
+
+        try:
+            started = time.time()
+            value = compute()
+            delta = time.time() - started
+            if timeout is DEFAULT_TIMEOUT:
+                timeout = self.remote.default_timeout
+            expires_at = math.inf if timeout is None else started + timeout
+            self.stats["recomputes"] += 1
+            self.set(key, (value, delta, expires_at), timeout, version=version)
+        finally:
+            if locked:
+                self.remote.delete(lock_key, version=version)
+        return value
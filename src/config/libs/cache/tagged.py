@@ -0,0 +1,62 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+GENERATION_PREFIX = "generation:"
+
+
+def namespace_key(namespace):
+    return f"{GENERATION_PREFIX}ns:{namespace}"
+
+
+def tag_key(tag):
+    return f"{GENERATION_PREFIX}tag:{tag}"
+
+
+def bump_generation(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+        return cache.incr(key)
+
+
+def model_tag(model):
+    return f"model:{model._meta.label_lower}"
+
+
+def invalidate_namespace(namespace):
+    """
+    Orphan every key of ``namespace``; old entries just expire on their own.
+    """
+    return bump_generation(namespace_key(namespace))
+
+
+def invalidate_tag(tag):
+    return bump_generation(tag_key(tag))
+
+
+def make_key(namespace, key, tags=()):
+    """
+    Versioned key embedding the current generation of the namespace and of
+    each tag, all read in one ``get_many`` round trip.
+    """
+    generation_keys = [namespace_key(namespace)] + [tag_key(tag) for tag in tags]
+    generations = cache.get_many(generation_keys)
+    version = ".".join(str(generations.get(k, 0)) for k in generation_keys)
+    if len(key) > 150:
+        key = hashlib.sha1(key.encode()).hexdigest()
+    return f"{namespace}:{version}:{key}"
+
+
+def get_value(namespace, key, tags=(), default=None):
+    return cache.get(make_key(namespace, key, tags), default)
+
+
+def set_value(namespace, key, value, timeout=DEFAULT_TIMEOUT, tags=()):
+    cache.set(make_key(namespace, key, tags), value, timeout)
+
+
+def get_or_set_value(namespace, key, default, timeout=DEFAULT_TIMEOUT, tags=()):
+    return cache.get_or_set(make_key(namespace, key, tags), default, timeout)
@@ -0,0 +1,217 @@
+from django.db import connections, models, transaction
+from django.db.models import ProtectedError
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from config.libs.db.signals import rows_changed
+
+archive_models = {}
+
+
+def get_archive_model(model):
+    return archive_models.get(model)
+
+
+AUTO_FIELD_COLUMNS = {
+    "AutoField": models.IntegerField,
+    "BigAutoField": models.BigIntegerField,
+    "SmallAutoField": models.SmallIntegerField,
+}
+
+
+def _archive_pk(field):
+    # Same column type as the live pk, but values are copied, never generated.
+    target = field.target_field if field.is_relation else field
+    column_class = AUTO_FIELD_COLUMNS.get(target.get_internal_type())
+    if column_class is not None:
+        return column_class(primary_key=True, db_column=field.column)
+    _, _, args, kwargs = target.deconstruct()
+    kwargs.update(primary_key=True, db_column=field.column)
+    return type(target)(*args, **kwargs)
+
+
+def _archive_field(field):
+    if field.primary_key:
+        return _archive_pk(field)
+    if field.is_relation:
+        # No constraint: the referenced row may be archived or purged later.
+        return models.ForeignKey(
+            field.remote_field.model,
+            on_delete=models.DO_NOTHING,
+            db_constraint=False,
+            related_name="+",
+            null=field.null,
+            db_column=field.column,
+        )
+    archived = field.clone()
+    archived._unique = False
+    archived.db_index = False
+    return archived
+
+
+class ArchiveQuerySet(models.QuerySet):
+    def restore(self, cascade=False):
+        """
+        Move the rows back into the live table with is_deleted cleared.
+        With ``cascade``, archived CASCADE children pointing at them are
+        restored too; otherwise they stay archived and their own archive must
+        be restored afterwards, parent first.
+        """
+        live_model = self.model.live_model
+        pks = list(self.values_list("pk", flat=True))
+        if not pks:
+            return 0
+        with transaction.atomic(using=self.db):
+            insert_select(
+                self.model.objects.using(self.db).filter(pk__in=pks),
+                live_model,
+                using=self.db,
+            )
+            live_model._base_manager.using(self.db).filter(pk__in=pks).update(
+                is_deleted=False, deleted_at=None
+            )
+            self.model.objects.using(self.db).filter(pk__in=pks).delete()
+            if cascade:
+                restore_children(live_model, pks, using=self.db)
+        rows_changed.send(sender=live_model)
+        return len(pks)
+
+
+def create_archive_model(model):
+    """
+    Build the companion ``<Model>Archive`` table for ``model`` and turn on
+    archive mode for it. Call it in the app's models module, e.g.
+    ``ProductArchive = create_archive_model(Product)``, so migrations see it.
+    """
+    attrs = {
+        "__module__": model.__module__,
+        "live_model": model,
+        "archived_at": models.DateTimeField(db_default=Now(), editable=False),
+        "objects": ArchiveQuerySet.as_manager(),
+        "Meta": type(
+            "Meta",
+            (),
+            {
+                "app_label": model._meta.app_label,
+                "db_table": f"{model._meta.db_table}_archive",
+                "indexes": [models.Index(fields=["archived_at"])],
+            },
+        ),
+    }
+    for field in model._meta.concrete_fields:
+        attrs[field.name] = _archive_field(field)
+
+    archive_model = type(f"{model.__name__}Archive", (models.Model,), attrs)
+    archive_models[model] = archive_model
+    return archive_model
+
+
+def insert_select(source_queryset, target_model, using=None):
+    """
+    ``INSERT INTO target (...) SELECT ... FROM source`` for the concrete
+    columns both tables share, without loading rows into Python.
+    """
+    target_columns = [field.column for field in target_model._meta.concrete_fields]
+    source_fields = {
+        field.column: field.attname
+        for field in source_queryset.model._meta.concrete_fields
+    }
+    columns = [column for column in target_columns if column in source_fields]
+
+    connection = connections[using or source_queryset.db]
+    sql, params = (
+        source_queryset.order_by()
+        .values_list(*(source_fields[column] for column in columns))
+        .query.sql_with_params()
+    )
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(target_model._meta.db_table)} "
+            f"({', '.join(quote(column) for column in columns)}) {sql}",
+            params,
+        )
+
+
+def get_auto_m2m_links(model):
+    """
+    (through model, field name pointing at ``model``) for every many-to-many
+    relation of ``model`` with an auto-created through table.
+    """
+    links = [
+        (field.remote_field.through, field.m2m_field_name())
+        for field in model._meta.many_to_many
+    ] + [
+        (relation.field.remote_field.through, relation.field.m2m_reverse_field_name())
+        for relation in model._meta.related_objects
+        if relation.many_to_many
+    ]
+    return [(through, name) for through, name in links if through._meta.auto_created]
+
+
+def archive_children(model, pks, using=None):
+    """
+    Archive the CASCADE children of the rows first, so the hard delete of the
+    parents does not silently drop them. Children without an archive model,
+    and many-to-many links (auto-created through rows have no archive), would
+    be lost, so they block the delete instead.
+    """
+    for through, name in get_auto_m2m_links(model):
+        links = through._base_manager.using(using).filter(**{f"{name}__in": pks})
+        if links.exists():
+            raise ProtectedError(
+                f"Cannot archive {model._meta.label} rows: their many-to-many "
+                f"links in {through._meta.label} cannot be archived.",
+                set(links[:100]),
+            )
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or relation.on_delete is not models.CASCADE:
+            continue
+        children = relation.related_model._base_manager.using(using).filter(
+            **{f"{relation.field.name}__pk__in": pks}
+        )
+        if relation.related_model in archive_models:
+            archive_rows(
+                relation.related_model,
+                children.values_list("pk", flat=True),
+                using=using,
+            )
+        elif children.exists():
+            raise ProtectedError(
+                f"Cannot archive {model._meta.label} rows: "
+                f"{relation.related_model._meta.label} has no archive model.",
+                set(children[:100]),
+            )
+
+
+def archive_rows(model, pks, using=None):
+    """
+    Flag the rows deleted, copy them into the archive table and remove them
+    from the live table.
+    """
+    archive_model = archive_models[model]
+    pks = list(pks)
+    if not pks:
+        return 0
+    with transaction.atomic(using=using):
+        archive_children(model, pks, using=using)
+        live = model._base_manager.using(using).filter(pk__in=pks)
+        live.update(is_deleted=True, deleted_at=timezone.now())
+        insert_select(live, archive_model, using=using)
+        live.delete()
+    rows_changed.send(sender=model)
+    return len(pks)
+
+
+def restore_children(model, pks, using=None):
+    """
+    Restore the archived CASCADE children of the restored rows, recursively.
+    """
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or relation.on_delete is not models.CASCADE:
+            continue
+        archive_model = archive_models.get(relation.related_model)
+        if archive_model is not None:
+            archive_model.objects.using(using).filter(
+                **{f"{relation.field.name}__in": pks}
+            ).restore(cascade=True)
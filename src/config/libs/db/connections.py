@@ -0,0 +1,71 @@
+import logging
+
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+
+def has_psycopg3() -> bool:
+    """Django's postgresql backend picks psycopg 3 whenever it is installed."""
+    try:
+        import psycopg  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_database_config(
+        url,
+        conn_max_age=60,
+        health_checks=True,
+        pool=False,
+        pool_min_size=2,
+        pool_max_size=10,
+        pgbouncer=False,
+):
+    """
+    DATABASES entry for ``url`` with one of these connection profiles:
+
+    - persistent: connections kept for ``conn_max_age`` seconds, optionally
+      checked before reuse.
+    - pool: psycopg 3 driver pool (Django 5.1+); CONN_MAX_AGE must be 0.
+    - pgbouncer: transaction pooling compatible, no server-side cursors and
+      no prepared statements.
+    """
+    if pool:
+        if not has_psycopg3():
+            raise ImproperlyConfigured(
+                "DB_POOL requires psycopg 3 (pip install psycopg[pool])"
+            )
+        conn_max_age = 0
+
+    config = dj_database_url.config(
+        default=url, conn_max_age=conn_max_age, conn_health_checks=health_checks
+    )
+    options = config.setdefault("OPTIONS", {})
+
+    if pool:
+        options["pool"] = {"min_size": pool_min_size, "max_size": pool_max_size}
+    if pgbouncer:
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        # Only psycopg 3 prepares statements server side, psycopg2 rejects the option.
+        if has_psycopg3():
+            options["prepare_threshold"] = None
+    return config
+
+
+def describe_database(alias, config):
+    options = config.get("OPTIONS", {})
+    return (
+        f"database {alias}: engine={config.get('ENGINE')} "
+        f"conn_max_age={config.get('CONN_MAX_AGE', 0)} "
+        f"health_checks={config.get('CONN_HEALTH_CHECKS', False)} "
+        f"pool={options.get('pool', False)} "
+        f"server_side_cursors={not config.get('DISABLE_SERVER_SIDE_CURSORS', False)}"
+    )
+
+
+def log_database_profiles(databases):
+    for alias, config in databases.items():
+        logger.info(describe_database(alias, config))
@@ -1,12 +1,78 @@
-from django.db import models
+from django.db import migrations, models
+from django.db.models.functions import Upper
+from django.db.models.lookups import Exact
+
+from config.libs.persian.normalizer import normalize_key
 
 
 class UpperCaseCharField(models.CharField):
-    def from_db_value(self, value, *args, **kwargs):
-        return self.to_python(value)
+    """
+    Stored uppercased, so rows are read back as-is and filters compare
+    against a plain B-tree index.
+    """
 
     def to_python(self, value):
         val = super().to_python(value)
         if isinstance(val, str):
             return val.upper()
         return val
+
+    def pre_save(self, model_instance, add):
+        value = self.to_python(super().pre_save(model_instance, add))
+        setattr(model_instance, self.attname, value)
+        return value
+
+    def get_prep_value(self, value):
+        return self.to_python(super().get_prep_value(value))
+
+
+@UpperCaseCharField.register_lookup
+class UpperCaseIExact(Exact):
+    # Values are already uppercased on both sides, so iexact is a plain equality.
+    lookup_name = "iexact"
+
+
+def uppercase_existing_rows(app_label, model_name, field_name):
+    """
+    Data migration operation uppercasing values written before
+    UpperCaseCharField normalized on write.
+    """
+
+    def forwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        model._base_manager.using(schema_editor.connection.alias).exclude(
+            **{field_name: Upper(field_name)}
+        ).update(**{field_name: Upper(field_name)})
+
+    return migrations.RunPython(forwards, migrations.RunPython.noop)
+
+
+class NormalizedKeyField(models.CharField):
+    """
+    Indexed column holding ``normalize_key`` of another field, kept in sync on
+    save. Filter values are normalized too, so ``filter(name_key=user_input)``
+    is an index lookup instead of an ``icontains`` scan.
+    """
+
+    def __init__(self, *args, source=None, **kwargs):
+        self.source = source
+        kwargs.setdefault("max_length", 255)
+        kwargs.setdefault("db_index", True)
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("blank", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        if self.source:
+            value = normalize_key(getattr(model_instance, self.source)) or ""
+            setattr(model_instance, self.attname, value)
+            return value
+        return super().pre_save(model_instance, add)
+
+    def get_prep_value(self, value):
+        return normalize_key(super().get_prep_value(value))
@@ -1,11 +1,100 @@
-from django.db import models
-from django.db.models import QuerySet
+import copy
+
+from django.db import models, transaction
+from django.db.backends.utils import names_digest
+from django.db.models import DEFERRED, F, Q, QuerySet
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
 from django.utils import timezone
 
+from config.libs.db.archive import archive_rows, get_archive_model
+from config.libs.db.signals import rows_changed
+
+
+def get_cascade_relations(model):
+    """
+    Reverse relations whose rows follow the parent on delete: CASCADE foreign
+    keys from other BaseModel subclasses.
+    """
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or relation.on_delete is not models.CASCADE:
+            continue
+        if issubclass(relation.related_model, BaseModel):
+            yield relation.related_model, relation.field.name
+
+
+def collect_cascade(model, pks, restore=False, using=None):
+    """
+    Walk reverse relations level by level and return ``{model: set(pks)}`` of
+    the descendants to flag. One SELECT per relation per level.
+
+    On restore only children deleted together with their parent (same
+    ``deleted_at``) are collected, so rows deleted on their own stay deleted.
+    """
+    collected = {}
+    pending = [(model, list(pks))]
+    while pending:
+        parent_model, parent_pks = pending.pop()
+        for related_model, field_name in get_cascade_relations(parent_model):
+            children = related_model._base_manager.using(using).filter(
+                **{f"{field_name}__pk__in": parent_pks}
+            )
+            if restore:
+                children = children.filter(
+                    is_deleted=True, deleted_at=F(f"{field_name}__deleted_at")
+                )
+            else:
+                children = children.filter(is_deleted=False)
+
+            seen = collected.setdefault(related_model, set())
+            new_pks = [
+                pk for pk in children.values_list("pk", flat=True) if pk not in seen
+            ]
+            if new_pks:
+                seen.update(new_pks)
+                pending.append((related_model, new_pks))
+    return collected
+
+
+def bulk_update_cascade(model, pks, values, restore=False, using=None):
+    pks = list(pks)
+    with transaction.atomic(using=using):
+        collected = collect_cascade(model, pks, restore=restore, using=using)
+        collected.setdefault(model, set()).update(pks)
+        updated = 0
+        for related_model, related_pks in collected.items():
+            if related_pks:
+                updated += related_model._base_manager.using(using).filter(
+                    pk__in=related_pks
+                ).update(**values)
+    for related_model in collected:
+        rows_changed.send(sender=related_model)
+    return updated
+
 
 class BaseModelQuerySet(QuerySet):
-    def delete(self):
-        return self.update(is_deleted=True, deleted_at=timezone.now())
+    def delete(self, cascade=False):
+        if get_archive_model(self.model) is not None:
+            pks = self.values_list("pk", flat=True)
+            return archive_rows(self.model, pks, using=self.db)
+        values = {"is_deleted": True, "deleted_at": timezone.now()}
+        if not cascade:
+            updated = self.update(**values)
+            rows_changed.send(sender=self.model)
+            return updated
+        pks = list(self.values_list("pk", flat=True))
+        return bulk_update_cascade(self.model, pks, values, using=self.db)
+
+    def restore(self, cascade=False):
+        values = {"is_deleted": False, "deleted_at": None}
+        if not cascade:
+            updated = self.update(**values)
+            rows_changed.send(sender=self.model)
+            return updated
+        pks = list(self.filter(is_deleted=True).values_list("pk", flat=True))
+        return bulk_update_cascade(
+            self.model, pks, values, restore=True, using=self.db
+        )
 
 
 class BaseModelManager(models.Manager):
@@ -13,6 +102,12 @@ class BaseModelManager(models.Manager):
         return BaseModelQuerySet(self.model, self._db).filter(is_deleted=False)
 
 
+class AllObjectsManager(models.Manager.from_queryset(BaseModelQuerySet)):
+    """
+    Includes soft-deleted rows, e.g. ``Model.all_objects.filter(...).restore()``.
+    """
+
+
 class BaseModel(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
@@ -21,14 +116,171 @@ class BaseModel(models.Model):
     modified_at = models.DateTimeField(auto_now=True, editable=False)
 
     objects = BaseModelManager()
+    all_objects = AllObjectsManager()
+
+    # Fields that get a partial index limited to live rows (WHERE is_deleted = false).
+    live_index_fields = ()
+
+    # Values as loaded from the database, aligned with _meta.concrete_fields.
+    _loaded_values = None
 
     class Meta:
         abstract = True
 
-    def delete(self, using=None, keep_parents=False):
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def _take_snapshot(self, field_names=None):
+        values = self.__dict__
+        fields = self._meta.concrete_fields
+        if field_names is None or self._loaded_values is None:
+            self._loaded_values = tuple(
+                _snapshot_value(values.get(field.attname, DEFERRED)) for field in fields
+            )
+            return
+        # Partial save: only the saved fields are now in sync with the database.
+        field_names = set(field_names)
+        self._loaded_values = tuple(
+            _snapshot_value(values.get(field.attname, DEFERRED))
+            if field.name in field_names or field.attname in field_names
+            else old
+            for field, old in zip(fields, self._loaded_values)
+        )
+
+    def get_dirty_fields(self):
+        """
+        Names of fields changed since load, or None when the instance was not
+        loaded from the database.
+        """
+        if self._loaded_values is None:
+            return None
+        values = self.__dict__
+        return [
+            field.name
+            for field, old in zip(self._meta.concrete_fields, self._loaded_values)
+            if field.attname in values
+            and (old is DEFERRED or values[field.attname] != old)
+        ]
+
+    @classmethod
+    def _get_pre_save_fields(cls):
+        """
+        Fields whose value is computed in ``pre_save`` (auto_now timestamps,
+        NormalizedKeyField, ...) and so must be written on every update.
+        """
+        if "_pre_save_fields" not in cls.__dict__:
+            cls._pre_save_fields = tuple(
+                field.name
+                for field in cls._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+                or (
+                    type(field).pre_save is not models.Field.pre_save
+                    and not isinstance(field, models.DateField)
+                )
+            )
+        return cls._pre_save_fields
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not kwargs.get("force_update")
+            and not self._state.adding
+        )
+        if tracked:
+            dirty_fields = self.get_dirty_fields()
+            if dirty_fields is not None:
+                if not dirty_fields:
+                    return
+                kwargs["update_fields"] = dirty_fields + [
+                    name
+                    for name in self._get_pre_save_fields()
+                    if name not in dirty_fields
+                ]
+        super().save(*args, **kwargs)
+        self._take_snapshot(None if tracked else kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # Reading a deferred field refreshes just that field, pending edits to
+        # the others must stay dirty.
+        self._take_snapshot(fields)
+
+    def delete(self, using=None, keep_parents=False, cascade=False):
+        if get_archive_model(type(self)) is not None:
+            archive_rows(type(self), [self.pk], using=using or self._state.db)
+            return
         self.is_deleted = True
         self.deleted_at = timezone.now()
-        self.save()
+        if cascade:
+            bulk_update_cascade(
+                type(self),
+                [self.pk],
+                {"is_deleted": True, "deleted_at": self.deleted_at},
+                using=using or self._state.db,
+            )
+            self._take_snapshot()
+        else:
+            self.save(using=using)
+
+    def restore(self, using=None, cascade=False):
+        if cascade:
+            bulk_update_cascade(
+                type(self),
+                [self.pk],
+                {"is_deleted": False, "deleted_at": None},
+                restore=True,
+                using=using or self._state.db,
+            )
+        self.is_deleted = False
+        self.deleted_at = None
+        if cascade:
+            self._take_snapshot()
+        else:
+            self.save(using=using)
 
     def full_delete(self, using=None, keep_parents=False):
         super(BaseModel, self).delete(using=using, keep_parents=keep_parents)
+
+
+def _snapshot_value(value):
+    # Mutable values (JSONField) are copied so in-place edits show up as changes.
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def get_live_index_name(model, field_name):
+    column = model._meta.get_field(field_name).column
+    table = model._meta.db_table
+    return f"{table[:10]}_{column[:7]}_{names_digest(table, column, length=6)}_live"
+
+
+def get_live_indexes(model):
+    return [
+        models.Index(
+            fields=[field_name],
+            condition=Q(is_deleted=False),
+            name=get_live_index_name(model, field_name),
+        )
+        for field_name in model.live_index_fields
+    ]
+
+
+@receiver(class_prepared)
+def add_live_indexes(sender, **kwargs):
+    if not issubclass(sender, BaseModel) or sender._meta.abstract:
+        return
+    live_indexes = get_live_indexes(sender)
+    if not live_indexes:
+        return
+    existing = {index.name for index in sender._meta.indexes}
+    sender._meta.indexes = list(sender._meta.indexes) + [
+        index for index in live_indexes if index.name not in existing
+    ]
+    # The migration autodetector only reads indexes declared in Meta.
+    sender._meta.original_attrs["indexes"] = sender._meta.indexes
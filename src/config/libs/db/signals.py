@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent with the model class as sender after bulk UPDATE/DELETE statements that
+# bypass post_save/post_delete (soft delete, restore, cascade, archive).
+rows_changed = Signal()
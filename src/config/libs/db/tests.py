@@ -0,0 +1,224 @@
+import uuid
+
+from django.db import connection, models
+from django.db.migrations.state import ModelState
+from django.db.models import ProtectedError
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from config.libs.db.archive import create_archive_model
+from config.libs.db.fields import NormalizedKeyField
+from config.libs.db.models import BaseModel, get_live_index_name
+
+
+class TrackedCity(BaseModel):
+    name = models.CharField(max_length=100)
+    name_key = NormalizedKeyField(source="name")
+    population = models.IntegerField(default=0)
+    tags = models.JSONField(default=list)
+    touched_at = models.DateTimeField(auto_now=True)
+
+    live_index_fields = ("name_key",)
+
+    class Meta:
+        app_label = "api"
+
+
+class LiveIndexTests(TestCase):
+    def test_live_indexes_reach_migration_state(self):
+        indexes = ModelState.from_model(TrackedCity).options["indexes"]
+        live_index = next(
+            index
+            for index in indexes
+            if index.name == get_live_index_name(TrackedCity, "name_key")
+        )
+        self.assertEqual(live_index.fields, ["name_key"])
+        self.assertIsNotNone(live_index.condition)
+
+
+class DirtyFieldTrackingTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            editor.create_model(TrackedCity)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            editor.delete_model(TrackedCity)
+
+    def setUp(self):
+        TrackedCity.objects.create(name="كرج", population=10)
+        self.city = TrackedCity.objects.get()
+
+    def test_save_without_changes_runs_no_query(self):
+        with self.assertNumQueries(0):
+            self.city.save()
+
+    def test_save_writes_changed_and_pre_save_columns_only(self):
+        self.city.population = 20
+        with CaptureQueriesContext(connection) as queries:
+            self.city.save()
+        sql = queries.captured_queries[0]["sql"]
+        self.assertIn('"population"', sql)
+        self.assertIn('"modified_at"', sql)
+        self.assertIn('"touched_at"', sql)
+        self.assertIn('"name_key"', sql)
+        self.assertNotIn('"name" =', sql)
+        self.assertNotIn('"created_at"', sql)
+
+    def test_pre_save_field_follows_renamed_source(self):
+        self.city.name = "تهران"
+        self.city.save()
+        self.assertTrue(TrackedCity.objects.filter(name_key="تهران").exists())
+
+    def test_auto_now_fields_are_updated(self):
+        touched_at = self.city.touched_at
+        self.city.population = 30
+        self.city.save()
+        self.city.refresh_from_db()
+        self.assertGreater(self.city.touched_at, touched_at)
+
+    def test_partial_save_keeps_other_changes_dirty(self):
+        self.city.name = "تهران"
+        self.city.population = 40
+        self.city.save(update_fields=["population"])
+        self.assertEqual(self.city.get_dirty_fields(), ["name"])
+        self.city.save()
+        self.assertEqual(self.city.get_dirty_fields(), [])
+        self.assertEqual(TrackedCity.objects.get().name, "تهران")
+
+    def test_in_place_json_edits_are_detected(self):
+        self.city.tags.append("capital")
+        self.assertEqual(self.city.get_dirty_fields(), ["tags"])
+
+    def test_assigned_deferred_field_is_saved(self):
+        city = TrackedCity.objects.only("id").get()
+        city.population = 99
+        city.save()
+        self.assertEqual(TrackedCity.objects.get().population, 99)
+
+    def test_loading_deferred_field_keeps_pending_changes(self):
+        city = TrackedCity.objects.defer("tags").get()
+        city.population = 55
+        city.tags
+        city.save()
+        self.assertEqual(TrackedCity.objects.get().population, 55)
+
+    def test_partial_refresh_keeps_other_changes(self):
+        self.city.name = "تهران"
+        self.city.refresh_from_db(fields=["population"])
+        self.assertEqual(self.city.get_dirty_fields(), ["name"])
+        self.city.save()
+        self.assertEqual(TrackedCity.objects.get().name, "تهران")
+
+
+class ArchParent(BaseModel):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+
+    class Meta:
+        app_label = "api"
+
+
+class ArchKid(BaseModel):
+    parent = models.ForeignKey(ArchParent, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "api"
+
+
+class ArchPet(BaseModel):
+    owner = models.ForeignKey(ArchKid, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "api"
+
+
+class ArchTag(models.Model):
+    parents = models.ManyToManyField(ArchParent)
+
+    class Meta:
+        app_label = "api"
+
+
+ArchParentArchive = create_archive_model(ArchParent)
+ArchKidArchive = create_archive_model(ArchKid)
+
+ARCHIVE_TEST_MODELS = [
+    ArchParent,
+    ArchKid,
+    ArchPet,
+    ArchTag,
+    ArchParentArchive,
+    ArchKidArchive,
+]
+
+
+class ArchiveTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            for model in ARCHIVE_TEST_MODELS:
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(ARCHIVE_TEST_MODELS):
+                editor.delete_model(model)
+
+    def test_archive_pk_keeps_live_pk_type(self):
+        self.assertIsInstance(ArchParentArchive._meta.pk, models.UUIDField)
+        self.assertIsInstance(ArchKidArchive._meta.pk, models.BigIntegerField)
+
+    def test_delete_archives_cascade_children_and_restores_them(self):
+        parent = ArchParent.objects.create()
+        ArchKid.objects.create(parent=parent)
+        ArchKid.objects.create(parent=parent)
+
+        parent.delete()
+
+        self.assertEqual(ArchKid._base_manager.count(), 0)
+        self.assertEqual(ArchKidArchive.objects.count(), 2)
+        self.assertEqual(ArchParentArchive.objects.get().pk, parent.pk)
+
+        ArchParentArchive.objects.all().restore()
+        self.assertEqual(ArchKidArchive.objects.count(), 2)
+        ArchKidArchive.objects.all().restore()
+        self.assertEqual(ArchParent.objects.get().pk, parent.pk)
+        self.assertEqual(ArchKid.objects.count(), 2)
+
+    def test_cascade_restore_brings_children_back(self):
+        parent = ArchParent.objects.create()
+        ArchKid.objects.create(parent=parent)
+        parent.delete()
+
+        ArchParentArchive.objects.all().restore(cascade=True)
+
+        self.assertEqual(ArchKid.objects.get().parent_id, parent.pk)
+        self.assertEqual(ArchKidArchive.objects.count(), 0)
+
+    def test_many_to_many_links_block_the_delete(self):
+        parent = ArchParent.objects.create()
+        ArchTag.objects.create().parents.add(parent)
+
+        with self.assertRaises(ProtectedError):
+            parent.delete()
+        self.assertEqual(ArchParent.objects.count(), 1)
+        self.assertEqual(ArchTag.parents.through.objects.count(), 1)
+        self.assertEqual(ArchParentArchive.objects.count(), 0)
+
+    def test_children_without_archive_block_the_delete(self):
+        parent = ArchParent.objects.create()
+        kid = ArchKid.objects.create(parent=parent)
+        ArchPet.objects.create(owner=kid)
+
+        with self.assertRaises(ProtectedError):
+            parent.delete()
+        self.assertEqual(ArchParent.objects.count(), 1)
+        self.assertEqual(ArchKid.objects.count(), 1)
+        self.assertEqual(ArchKidArchive.objects.count(), 0)
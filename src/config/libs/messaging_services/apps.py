@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class MessagingServicesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "config.libs.messaging_services"
+    label = "messaging_services"
@@ -1,16 +1,37 @@
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+import logging
+import smtplib
+import time
+
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 
 from config import settings
+from config.libs.messaging_services.email_templates import render_email
+
+logger = logging.getLogger(__name__)
+
+OTP_SUBJECT = "تیپوش | کد تایید"
+
+
+def build_otp_email(
+        to, context, template_name="emails/email_otp.html", subject=OTP_SUBJECT
+):
+    html_message, plain_message = render_email(template_name, context)
+    message = EmailMultiAlternatives(
+        subject, plain_message, settings.EMAIL_HOST_FROM_ADDRESS, [to]
+    )
+    message.attach_alternative(html_message, "text/html")
+    return message
 
 
 def send_otp_email(
-        to, context, template_name="emails/email_otp.html", subject="تیپوش | کد تایید"
+        to,
+        context,
+        template_name="emails/email_otp.html",
+        subject=OTP_SUBJECT,
+        connection=None,
 ):
     try:
-        html_message = render_to_string(template_name, context)
-        plain_message = strip_tags(html_message)
+        html_message, plain_message = render_email(template_name, context)
 
         from_email = settings.EMAIL_HOST_FROM_ADDRESS
         send_mail(
@@ -20,7 +41,82 @@ def send_otp_email(
             [to],
             html_message=html_message,
             fail_silently=False,
+            connection=connection,
         )
         return True
-    except Exception as e:
-        print(e)
+    except Exception:
+        logger.exception("Failed to send OTP email to %s", to)
+
+
+def send_bulk_email(messages, rate_limit=None):
+    """
+    Send EmailMessage objects over a single SMTP session.
+
+    ``rate_limit`` is the provider limit in messages per second. A message that
+    fails is retried once on a fresh connection so a dropped session does not
+    abort the batch; refused recipients are not retried. Returns a list of
+    booleans, one per message.
+    """
+    rate_limit = rate_limit or getattr(settings, "EMAIL_RATE_LIMIT", None)
+    interval = 1 / rate_limit if rate_limit else 0
+    results = []
+
+    connection = open_connection()
+    try:
+        for message in messages:
+            started = time.monotonic()
+            try:
+                message.connection = connection
+                sent = bool(message.send())
+            except smtplib.SMTPRecipientsRefused:
+                # The session is still usable, retrying would be refused again.
+                logger.warning("Recipients refused: %s", message.to)
+                sent = False
+            except Exception:
+                logger.exception("Failed to send email to %s, retrying", message.to)
+                connection.close()
+                sent = _send_single(message)
+                connection = open_connection()
+            results.append(sent)
+
+            elapsed = time.monotonic() - started
+            if interval > elapsed:
+                time.sleep(interval - elapsed)
+    finally:
+        connection.close()
+    return results
+
+
+def open_connection():
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception:
+        # An unopened connection still works, it just opens a session per message.
+        logger.exception("Failed to open SMTP connection")
+    return connection
+
+
+def _send_single(message):
+    try:
+        message.connection = get_connection(fail_silently=False)
+        return bool(message.send())
+    except Exception:
+        logger.exception("Failed to send email to %s", message.to)
+        return False
+
+
+def send_bulk_otp_email(
+        recipients,
+        template_name="emails/email_otp.html",
+        subject=OTP_SUBJECT,
+        rate_limit=None,
+):
+    """
+    ``recipients`` is an iterable of ``(to, context)`` pairs.
+    """
+    messages = [
+        build_otp_email(to, context, template_name, subject)
+        for to, context in recipients
+    ]
+    return send_bulk_email(messages, rate_limit=rate_limit)
@@ -0,0 +1,58 @@
+from functools import lru_cache
+
+from django.template.loader import render_to_string
+from django.utils.html import escape, strip_tags
+
+PLACEHOLDER = "\x00{name}\x00"
+
+
+class PrerenderedEmailTemplate:
+    """
+    Renders a template once with placeholder values and keeps the HTML and the
+    plain-text (``strip_tags``) versions split around them, so sending only
+    joins strings. Variables must be printed as-is in the template (no filters).
+    """
+
+    def __init__(self, template_name, variables):
+        self.template_name = template_name
+        self.variables = tuple(variables)
+
+        placeholders = {name: PLACEHOLDER.format(name=name) for name in self.variables}
+        html = render_to_string(template_name, placeholders)
+        self.html_parts = self._split(html)
+        self.plain_parts = self._split(strip_tags(html))
+
+    @staticmethod
+    def _split(text):
+        # Odd chunks are variable names, kept as 1-tuples to tell them apart.
+        return [
+            (chunk,) if index % 2 else chunk
+            for index, chunk in enumerate(text.split("\x00"))
+        ]
+
+    @staticmethod
+    def _join(parts, context, escape_values):
+        return "".join(
+            part
+            if isinstance(part, str)
+            else (escape(context[part[0]]) if escape_values else str(context[part[0]]))
+            for part in parts
+        )
+
+    def render(self, context):
+        return (
+            self._join(self.html_parts, context, escape_values=True),
+            self._join(self.plain_parts, context, escape_values=False),
+        )
+
+
+@lru_cache(maxsize=32)
+def get_email_template(template_name, variables) -> PrerenderedEmailTemplate:
+    return PrerenderedEmailTemplate(template_name, variables)
+
+
+def render_email(template_name, context):
+    """
+    Return ``(html_message, plain_message)`` for ``context``.
+    """
+    return get_email_template(template_name, tuple(sorted(context))).render(context)
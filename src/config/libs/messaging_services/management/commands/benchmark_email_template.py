@@ -0,0 +1,32 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+from config.libs.messaging_services.email_templates import render_email
+
+
+class Command(BaseCommand):
+    help = "Compare per-email render cost of render_to_string + strip_tags vs prerendered templates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--template", default="emails/email_otp.html")
+        parser.add_argument("--number", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        template_name = options["template"]
+        number = options["number"]
+        context = {"code": "123456"}
+
+        def legacy():
+            html = render_to_string(template_name, context)
+            return html, strip_tags(html)
+
+        def prerendered():
+            return render_email(template_name, context)
+
+        prerendered()
+        for name, func in (("render_to_string", legacy), ("prerendered", prerendered)):
+            seconds = timeit.timeit(func, number=number)
+            self.stdout.write(f"{name}: {seconds / number * 1_000_000:.1f} us/email")
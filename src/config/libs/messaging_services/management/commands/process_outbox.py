@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from config.libs.messaging_services.outbox import process_batch
+
+
+class Command(BaseCommand):
+    help = "Deliver queued OTP and order SMS/email messages from the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep polling instead of exiting"
+        )
+        parser.add_argument("--sleep", type=float, default=2.0)
+
+    def handle(self, *args, **options):
+        while True:
+            claimed, sent = process_batch(options["batch_size"])
+            if claimed:
+                self.stdout.write(f"Processed {claimed} messages, {sent} sent\n")
+            if not options["loop"]:
+                break
+            if claimed < options["batch_size"]:
+                time.sleep(options["sleep"])
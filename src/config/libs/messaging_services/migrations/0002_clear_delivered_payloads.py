@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def clear_delivered_payloads(apps, schema_editor):
+    OutboxMessage = apps.get_model("messaging_services", "OutboxMessage")
+    OutboxMessage.objects.using(schema_editor.connection.alias).filter(
+        status__in=["sent", "dead"]
+    ).update(payload={})
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("messaging_services", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_delivered_payloads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+import hashlib
+import hmac
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.api.enums import ResponseMessage
+from config.libs.validator.validators import canonicalize_username
+
+OTP_LENGTH = getattr(settings, "OTP_LENGTH", 6)
+OTP_TTL = getattr(settings, "OTP_TTL", 120)
+OTP_RESEND_INTERVAL = getattr(settings, "OTP_RESEND_INTERVAL", 60)
+OTP_MAX_RESENDS = getattr(settings, "OTP_MAX_RESENDS", 5)
+OTP_RESEND_WINDOW = getattr(settings, "OTP_RESEND_WINDOW", 60 * 60)
+OTP_MAX_ATTEMPTS = getattr(settings, "OTP_MAX_ATTEMPTS", 5)
+
+
+def _keys(destination, purpose):
+    _, value = canonicalize_username(destination)
+    base = f"otp:{purpose}:{value or destination}"
+    return {
+        "code": f"{base}:code",
+        "attempts": f"{base}:attempts",
+        "resends": f"{base}:resends",
+        "cooldown": f"{base}:cooldown",
+    }
+
+
+def _hash_code(key, code):
+    return hmac.new(
+        settings.SECRET_KEY.encode(), f"{key}:{code}".encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def _incr(key, timeout):
+    # add() is a no-op when the counter exists, so the window is not extended.
+    cache.add(key, 0, timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout)
+        return 1
+
+
+def issue_otp(destination, purpose="login"):
+    """
+    Create a code for ``destination`` (phone or email, canonicalized first).
+    Returns ``(code, message)``; code is None when the request is refused.
+    Only the code's hash is stored.
+    """
+    keys = _keys(destination, purpose)
+
+    if not cache.add(keys["cooldown"], 1, OTP_RESEND_INTERVAL):
+        return None, ResponseMessage.AUTH_OTP_ALREADY_SENT
+    if _incr(keys["resends"], OTP_RESEND_WINDOW) > OTP_MAX_RESENDS:
+        return None, ResponseMessage.AUTH_OTP_TOO_MANY_REQUESTS
+
+    code = "".join(secrets.choice("0123456789") for _ in range(OTP_LENGTH))
+    cache.set_many(
+        {keys["code"]: _hash_code(keys["code"], code), keys["attempts"]: 0}, OTP_TTL
+    )
+    return code, ResponseMessage.SUCCESS
+
+
+def verify_otp(destination, code, purpose="login"):
+    """
+    Check ``code`` in constant time. Returns ``(is_valid, message)``.
+    A code is single use and is dropped after OTP_MAX_ATTEMPTS wrong tries.
+    """
+    keys = _keys(destination, purpose)
+    try:
+        attempts = cache.incr(keys["attempts"])
+    except ValueError:
+        return False, ResponseMessage.AUTH_OTP_EXPIRED
+
+    if attempts > OTP_MAX_ATTEMPTS:
+        cache.delete_many([keys["code"], keys["attempts"]])
+        return False, ResponseMessage.AUTH_OTP_TOO_MANY_ATTEMPTS
+
+    stored = cache.get(keys["code"])
+    if stored is None:
+        return False, ResponseMessage.AUTH_OTP_EXPIRED
+    if not hmac.compare_digest(stored, _hash_code(keys["code"], str(code))):
+        return False, ResponseMessage.AUTH_WRONG_OTP
+
+    cache.delete_many([keys["code"], keys["attempts"], keys["cooldown"]])
+    return True, ResponseMessage.SUCCESS
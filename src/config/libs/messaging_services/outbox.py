@@ -0,0 +1,203 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from config.libs.messaging_services.email_service import (
+    open_connection,
+    send_otp_email,
+)
+from config.libs.messaging_services.models import OutboxMessage
+
+OTP_EMAIL = "otp_email"
+OTP_PHONE = "otp_phone"
+ORDER_STATUS_PHONE = "order_status_phone"
+
+KIND_CHANNELS = {
+    OTP_EMAIL: OutboxMessage.Channel.EMAIL,
+    OTP_PHONE: OutboxMessage.Channel.SMS,
+    ORDER_STATUS_PHONE: OutboxMessage.Channel.SMS,
+}
+
+
+def enqueue(kind, recipient, payload=None, max_attempts=5) -> OutboxMessage:
+    return OutboxMessage.objects.create(
+        channel=KIND_CHANNELS[kind],
+        kind=kind,
+        recipient=str(recipient),
+        payload=payload or {},
+        max_attempts=max_attempts,
+        available_at=timezone.now(),
+    )
+
+
+def enqueue_otp_email(to, context, template_name="emails/email_otp.html", subject=None):
+    payload = {"context": context, "template_name": template_name}
+    if subject:
+        payload["subject"] = subject
+    return enqueue(OTP_EMAIL, to, payload)
+
+
+def enqueue_otp_phone(to, code):
+    return enqueue(OTP_PHONE, to, {"code": str(code)})
+
+
+def enqueue_order_status_phone(to, pattern, number, track_code=None):
+    payload = {"pattern": str(pattern), "number": str(number), "track_code": track_code}
+    return enqueue(ORDER_STATUS_PHONE, to, payload)
+
+
+def get_delivery_status(message_id):
+    return (
+        OutboxMessage.objects.filter(pk=message_id)
+        .values("status", "attempts", "sent_at", "last_error")
+        .first()
+    )
+
+
+def _deliver_otp_email(message, connection=None):
+    kwargs = {
+        "template_name": message.payload["template_name"],
+        "connection": connection,
+    }
+    if message.payload.get("subject"):
+        kwargs["subject"] = message.payload["subject"]
+    if not send_otp_email(message.recipient, message.payload["context"], **kwargs):
+        raise RuntimeError("email delivery failed")
+
+
+def _deliver_otp_phone(message, connection=None):
+    from config.libs.messaging_services.phone_service import send_otp_phone
+
+    send_otp_phone(message.recipient, message.payload["code"])
+
+
+def _deliver_order_status_phone(message, connection=None):
+    from config.libs.messaging_services.phone_service import send_order_status_phone
+
+    send_order_status_phone(
+        message.recipient,
+        message.payload["pattern"],
+        message.payload["number"],
+        message.payload.get("track_code"),
+    )
+
+
+HANDLERS = {
+    OTP_EMAIL: _deliver_otp_email,
+    OTP_PHONE: _deliver_otp_phone,
+    ORDER_STATUS_PHONE: _deliver_order_status_phone,
+}
+
+
+def claim_batch(batch_size=50, lease_seconds=None):
+    """
+    Lease up to ``batch_size`` due messages and return them.
+    SKIP LOCKED lets several workers share the table without double sending.
+    A claimed message stays SENDING until ``available_at`` (now + lease); if
+    the worker dies before recording the outcome, the next claim picks it up
+    again. Attempts are counted at claim time so a message that keeps
+    crashing its worker still ends up DEAD.
+    """
+    if lease_seconds is None:
+        lease_seconds = getattr(settings, "OUTBOX_LEASE_SECONDS", 300)
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=[
+                    OutboxMessage.Status.PENDING,
+                    OutboxMessage.Status.FAILED,
+                    OutboxMessage.Status.SENDING,
+                ],
+                available_at__lte=now,
+            )
+            .order_by("available_at")[:batch_size]
+        )
+        expired = [
+            m.pk
+            for m in messages
+            if m.status == OutboxMessage.Status.SENDING
+            and m.attempts >= m.max_attempts
+        ]
+        if expired:
+            OutboxMessage.objects.filter(pk__in=expired).update(
+                status=OutboxMessage.Status.DEAD,
+                payload={},
+                last_error="lease expired",
+                modified_at=now,
+            )
+        messages = [m for m in messages if m.pk not in expired]
+        available_at = now + timedelta(seconds=lease_seconds)
+        OutboxMessage.objects.filter(pk__in=[m.pk for m in messages]).update(
+            status=OutboxMessage.Status.SENDING,
+            attempts=F("attempts") + 1,
+            available_at=available_at,
+            modified_at=now,
+        )
+    for message in messages:
+        message.status = OutboxMessage.Status.SENDING
+        message.attempts += 1
+        message.available_at = available_at
+    return messages
+
+
+def retry_delay(attempts, base_seconds=30):
+    return timedelta(seconds=base_seconds * 2 ** (attempts - 1))
+
+
+def deliver(message, connection=None) -> bool:
+    try:
+        HANDLERS[message.kind](message, connection=connection)
+    except Exception as e:
+        message.last_error = str(e)
+        if message.attempts >= message.max_attempts:
+            message.status = OutboxMessage.Status.DEAD
+        else:
+            message.status = OutboxMessage.Status.FAILED
+            message.available_at = timezone.now() + retry_delay(message.attempts)
+    else:
+        message.status = OutboxMessage.Status.SENT
+        message.sent_at = timezone.now()
+        message.last_error = ""
+    if message.status in (OutboxMessage.Status.SENT, OutboxMessage.Status.DEAD):
+        # Payloads carry OTP codes and email contexts, don't keep them around.
+        message.payload = {}
+    message.save(
+        update_fields=[
+            "attempts",
+            "status",
+            "payload",
+            "available_at",
+            "sent_at",
+            "last_error",
+            "modified_at",
+        ]
+    )
+    return message.status == OutboxMessage.Status.SENT
+
+
+def process_batch(batch_size=50):
+    messages = claim_batch(batch_size)
+    email_connection = None
+    sent = 0
+    try:
+        for message in messages:
+            if message.channel != OutboxMessage.Channel.EMAIL:
+                sent += deliver(message)
+                continue
+            if email_connection is None:
+                email_connection = open_connection()
+            if deliver(message, connection=email_connection):
+                sent += 1
+            else:
+                # The SMTP session may be broken, don't reuse it for the rest.
+                email_connection.close()
+                email_connection = None
+    finally:
+        if email_connection is not None:
+            email_connection.close()
+    return len(messages), sent
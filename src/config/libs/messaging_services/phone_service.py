@@ -1,45 +1,39 @@
-import json
+import logging
 
-import requests
-from django.conf import settings
+from config.libs.messaging_services.sms_client import get_sms_client
 
-api_key = settings.FARAZ_SMS_API
+logger = logging.getLogger(__name__)
 
-url = "https://api2.ippanel.com/api/v1/sms/pattern/normal/send"
+OTP_PATTERN = "5s7bdcfd1hm6fuv"
 
 
 def send_otp_phone(to, code):
-    payload = json.dumps(
-        {
-            "code": "5s7bdcfd1hm6fuv",
-            "sender": "+983000505",
-            "recipient": str(to),
-            "variable": {"code": str(code)},
-        }
-    )
-    headers = {"apikey": api_key, "Content-Type": "application/json"}
+    return get_sms_client().send_pattern(to, OTP_PATTERN, {"code": str(code)})
 
-    response = requests.request("POST", url, headers=headers, data=payload)
-    return response.json()
 
+async def asend_otp_phone(to, code):
+    return await get_sms_client().asend_pattern(to, OTP_PATTERN, {"code": str(code)})
 
-def send_order_status_phone(to, pattern, number, track_code=None) -> None:
+
+def get_order_status_values(number, track_code=None):
     pattern_values = {
         "order_number": str(number),
     }
 
     if track_code:
         pattern_values["track_code"] = str(track_code)
+    return pattern_values
+
 
-    payload = json.dumps(
-        {
-            "code": str(pattern),
-            "sender": "+983000505",
-            "recipient": str(to),
-            "variable": pattern_values,
-        }
+def send_order_status_phone(to, pattern, number, track_code=None) -> None:
+    response = get_sms_client().send_pattern(
+        to, pattern, get_order_status_values(number, track_code)
     )
-    headers = {"apikey": api_key, "Content-Type": "application/json"}
+    logger.info("Order status SMS sent to %s: %s", to, response)
+
 
-    response = requests.request("POST", url, headers=headers, data=payload)
-    print(response.json())
+async def asend_order_status_phone(to, pattern, number, track_code=None) -> None:
+    response = await get_sms_client().asend_pattern(
+        to, pattern, get_order_status_values(number, track_code)
+    )
+    logger.info("Order status SMS sent to %s: %s", to, response)
@@ -0,0 +1,99 @@
+import json
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_URL = "https://api2.ippanel.com/api/v1/sms/pattern/normal/send"
+
+
+class SmsError(Exception):
+    pass
+
+
+class SmsClient:
+    """
+    Shared ippanel client with a keep-alive connection pool and bounded timeouts.
+
+    Only failures where the request never reached the provider (connect errors)
+    are retried, so a code is never sent twice. HTTP errors and ippanel error
+    statuses raise SmsError.
+    """
+
+    def __init__(
+            self,
+            api_key,
+            url=DEFAULT_URL,
+            connect_timeout=3.05,
+            read_timeout=10,
+            retries=3,
+            backoff_factor=0.5,
+            pool_maxsize=10,
+    ):
+        self.api_key = api_key
+        self.url = url
+        self.timeout = (connect_timeout, read_timeout)
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            backoff_factor=backoff_factor,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"apikey": str(api_key), "Content-Type": "application/json"}
+        )
+
+    def send_pattern(self, to, pattern, variables, sender="+983000505"):
+        payload = json.dumps(
+            {
+                "code": str(pattern),
+                "sender": sender,
+                "recipient": str(to),
+                "variable": variables,
+            }
+        )
+        response = self.session.post(self.url, data=payload, timeout=self.timeout)
+        try:
+            response.raise_for_status()
+            body = response.json()
+        except (requests.HTTPError, ValueError) as e:
+            raise SmsError(
+                f"ippanel request failed ({response.status_code}): {response.text[:200]}"
+            ) from e
+        if isinstance(body, dict) and str(body.get("status", "OK")).upper() != "OK":
+            raise SmsError(f"ippanel rejected the message: {body}")
+        return body
+
+    async def asend_pattern(self, to, pattern, variables, sender="+983000505"):
+        return await sync_to_async(self.send_pattern, thread_sensitive=False)(
+            to, pattern, variables, sender
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+
+
+def get_sms_client() -> SmsClient:
+    global _client
+    if _client is None:
+        _client = SmsClient(
+            api_key=settings.FARAZ_SMS_API,
+            url=getattr(settings, "FARAZ_SMS_URL", DEFAULT_URL),
+            connect_timeout=getattr(settings, "SMS_CONNECT_TIMEOUT", 3.05),
+            read_timeout=getattr(settings, "SMS_READ_TIMEOUT", 10),
+            retries=getattr(settings, "SMS_MAX_RETRIES", 3),
+        )
+    return _client
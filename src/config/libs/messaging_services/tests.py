@@ -0,0 +1,94 @@
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from config.libs.messaging_services import email_service, outbox
+from config.libs.messaging_services.models import OutboxMessage
+from config.libs.messaging_services.sms_client import SmsError
+
+
+class OutboxTests(TestCase):
+    def test_claim_leases_messages(self):
+        message = outbox.enqueue_otp_phone("09120000000", "123456")
+
+        claimed = outbox.claim_batch(lease_seconds=60)
+        message.refresh_from_db()
+
+        self.assertEqual([m.pk for m in claimed], [message.pk])
+        self.assertEqual(message.status, OutboxMessage.Status.SENDING)
+        self.assertEqual(message.attempts, 1)
+        self.assertGreater(message.available_at, timezone.now())
+        self.assertEqual(outbox.claim_batch(), [])
+
+    def test_expired_lease_is_reclaimed(self):
+        message = outbox.enqueue_otp_phone("09120000000", "123456")
+        outbox.claim_batch(lease_seconds=60)
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            available_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        claimed = outbox.claim_batch(lease_seconds=60)
+
+        self.assertEqual([m.pk for m in claimed], [message.pk])
+        self.assertEqual(claimed[0].attempts, 2)
+
+    def test_expired_lease_on_last_attempt_is_dead(self):
+        message = outbox.enqueue(outbox.OTP_PHONE, "09120000000", {"code": "1"}, 1)
+        outbox.claim_batch(lease_seconds=60)
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            available_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(outbox.claim_batch(), [])
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.Status.DEAD)
+        self.assertEqual(message.payload, {})
+
+    def test_payload_is_cleared_once_sent(self):
+        message = outbox.enqueue_otp_phone("09120000000", "123456")
+
+        with mock.patch(
+            "config.libs.messaging_services.phone_service.send_otp_phone"
+        ) as send_otp_phone:
+            self.assertEqual(outbox.process_batch(), (1, 1))
+
+        send_otp_phone.assert_called_once_with("09120000000", "123456")
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.Status.SENT)
+        self.assertEqual(message.payload, {})
+
+    def test_provider_rejection_is_not_sent(self):
+        message = outbox.enqueue_otp_phone("09120000000", "123456")
+
+        with mock.patch(
+            "config.libs.messaging_services.phone_service.send_otp_phone",
+            side_effect=SmsError("rejected"),
+        ):
+            self.assertEqual(outbox.process_batch(), (1, 0))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.Status.FAILED)
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(message.last_error, "rejected")
+        self.assertEqual(message.payload, {"code": "123456"})
+
+
+class SendBulkEmailTests(SimpleTestCase):
+    def test_refused_recipients_are_not_retried(self):
+        refused = mock.Mock(to=["bad@example.com"])
+        refused.send.side_effect = smtplib.SMTPRecipientsRefused({})
+        ok = mock.Mock(to=["good@example.com"])
+        ok.send.return_value = 1
+
+        with (
+            mock.patch.object(email_service, "open_connection") as open_connection,
+            mock.patch.object(email_service, "_send_single") as send_single,
+        ):
+            results = email_service.send_bulk_email([refused, ok])
+
+        self.assertEqual(results, [False, True])
+        send_single.assert_not_called()
+        self.assertEqual(open_connection.call_count, 1)
@@ -0,0 +1,72 @@
+from bisect import bisect_left
+from functools import lru_cache
+
+from config.libs.persian.cities import cities
+from config.libs.persian.normalizer import normalize_key
+from config.libs.persian.province import province
+
+
+class SortedNameIndex:
+    """
+    Names sorted by their normalized key, with O(log n) membership and prefix
+    search. Queries are normalized the same way, so spelling variants match.
+    """
+
+    def __init__(self, names):
+        by_key = {}
+        for name in names:
+            by_key.setdefault(normalize_key(name), name)
+        self.keys = sorted(by_key)
+        self.names = [by_key[key] for key in self.keys]
+        self._by_key = by_key
+
+    def __contains__(self, name):
+        return normalize_key(name) in self._by_key
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get(self, name):
+        return self._by_key.get(normalize_key(name))
+
+    def startswith(self, prefix, limit=10):
+        prefix = normalize_key(prefix)
+        start = bisect_left(self.keys, prefix)
+        # Every string with this prefix sorts below prefix + the highest code point.
+        end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.names[start:end]
+
+
+@lru_cache(maxsize=None)
+def get_city_index() -> SortedNameIndex:
+    return SortedNameIndex(name for name, _ in cities)
+
+
+@lru_cache(maxsize=None)
+def get_province_index() -> SortedNameIndex:
+    return SortedNameIndex(name for name, _ in province)
+
+
+def is_valid_city(name) -> bool:
+    return name in get_city_index()
+
+
+def is_valid_province(name) -> bool:
+    return name in get_province_index()
+
+
+# Province -> cities lookup is blocked on data: cities.py and province.py carry no
+# relation between the two (cities.py repeats names that exist in several
+# provinces without saying which), and no authoritative source is vendored yet.
+# Add the mapping next to them, then get_province_cities() and a
+# provinces/<name>/cities/ endpoint alongside the autocomplete views.
+
+
+def autocomplete_cities(prefix, limit=10) -> list:
+    return get_city_index().startswith(prefix, limit)
+
+
+def autocomplete_provinces(prefix, limit=10) -> list:
+    return get_province_index().startswith(prefix, limit)
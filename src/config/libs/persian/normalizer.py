@@ -0,0 +1,64 @@
+import re
+
+ARABIC_TO_PERSIAN = {
+    "ي": "ی",
+    "ى": "ی",
+    "ئ": "ی",
+    "ك": "ک",
+    "ة": "ه",
+    "ۀ": "ه",
+    "أ": "ا",
+    "إ": "ا",
+    "ٱ": "ا",
+    "ؤ": "و",
+}
+DIGITS = {
+    **{chr(0x06F0 + i): str(i) for i in range(10)},  # Persian
+    **{chr(0x0660 + i): str(i) for i in range(10)},  # Arabic-Indic
+}
+SPACES = {
+    "‌": " ",  # ZWNJ
+    "‍": "",  # ZWJ
+    "‏": "",  # RLM
+    "‎": "",  # LRM
+    " ": " ",
+    "\t": " ",
+    "\n": " ",
+    "\r": " ",
+}
+# Tatweel and Arabic diacritics carry no meaning for matching.
+REMOVED = {chr(c): None for c in [0x0640, *range(0x064B, 0x0653), 0x0670]}
+
+TEXT_TABLE = str.maketrans({**ARABIC_TO_PERSIAN, **DIGITS, **SPACES, **REMOVED})
+
+_multi_space = re.compile(r" {2,}")
+
+
+def normalize(text):
+    """
+    Unify Arabic/Persian letters and digits, drop diacritics and collapse spacing.
+    """
+    if not text:
+        return text
+    text = text.translate(TEXT_TABLE)
+    if "  " in text:
+        text = _multi_space.sub(" ", text)
+    return text.strip()
+
+
+def normalize_key(text):
+    """
+    Stricter form used for lookups and indexed key columns: spaces removed
+    and latin letters lowercased, so "آران وبیدگل" and "آران و بیدگل" match.
+    """
+    if not text:
+        return text
+    return text.translate(TEXT_TABLE).replace(" ", "").lower()
+
+
+def normalize_many(texts):
+    return [normalize(text) for text in texts]
+
+
+def normalize_keys(texts):
+    return [normalize_key(text) for text in texts]
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from config.libs.persian import views
+
+urlpatterns = [
+    path("cities/", views.CityAutocompleteView.as_view(), name="persian-cities"),
+    path(
+        "provinces/", views.ProvinceAutocompleteView.as_view(), name="persian-provinces"
+    ),
+]
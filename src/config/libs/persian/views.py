@@ -0,0 +1,48 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from config.api.enums import ResponseMessage
+from config.api.response import BaseResponse
+from config.libs.persian.lookup import autocomplete_cities, autocomplete_provinces
+
+LOOKUP_CACHE_TIMEOUT = 60 * 60 * 24
+MAX_LIMIT = 50
+
+
+def get_limit(request, default=10):
+    try:
+        return max(1, min(int(request.query_params.get("limit", default)), MAX_LIMIT))
+    except ValueError:
+        return default
+
+
+@method_decorator(cache_page(LOOKUP_CACHE_TIMEOUT), name="get")
+class CityAutocompleteView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        prefix = request.query_params.get("q", "").strip()
+        return BaseResponse(
+            data=autocomplete_cities(prefix, get_limit(request)),
+            status=status.HTTP_200_OK,
+            message=ResponseMessage.SUCCESS.value,
+        )
+
+
+@method_decorator(cache_page(LOOKUP_CACHE_TIMEOUT), name="get")
+class ProvinceAutocompleteView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        prefix = request.query_params.get("q", "").strip()
+        return BaseResponse(
+            data=autocomplete_provinces(prefix, get_limit(request)),
+            status=status.HTTP_200_OK,
+            message=ResponseMessage.SUCCESS.value,
+        )
+
@@ -0,0 +1,12 @@
+from django.test import SimpleTestCase
+
+from config.libs.validator.validators import validate_password
+
+
+class ValidatePasswordTests(SimpleTestCase):
+    def test_persian_and_arabic_digits_count(self):
+        for password in ("Abcdef1", "Abcdef۱", "Abcdef١"):
+            self.assertTrue(validate_password(password)[0], password)
+
+    def test_missing_digit_is_rejected(self):
+        self.assertFalse(validate_password("Abcdefg")[0])
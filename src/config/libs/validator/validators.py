@@ -1,15 +1,30 @@
 import re
 
+from config.libs.persian.normalizer import DIGITS
+
 email_regex = r"^\S+@\S+\.\S+$"
 phone_regex = r"^(\+98|0)?9\d{9}$"
 
+email_pattern = re.compile(email_regex)
+phone_regex_pattern = re.compile(phone_regex)
+# Also accepts the 0098 / 98 international prefixes, canonicalized below.
+phone_pattern = re.compile(r"^(?:\+98|0098|98|0)?(9\d{9})$")
+phone_cleanup_table = str.maketrans(
+    {**DIGITS, " ": None, "-": None, "(": None, ")": None}
+)
+
+PASSWORD_LENGTH_ERROR = "کلمه عبور باید حداقل 6 و حداکثر 18 حرف باشد"
+PASSWORD_UPPERCASE_ERROR = "کلمه عبور باید حداقل شامل یک حرف بزرگ باشد"
+PASSWORD_LOWERCASE_ERROR = "کلمه عبور باید حداقل شامل یک حرف کوچک باشد"
+PASSWORD_DIGIT_ERROR = "کلمه عبور باید شامل عدد باشد"
+
 
 def validate_phone(phone):
-    return re.match(phone_regex, phone)
+    return phone_regex_pattern.match(phone)
 
 
 def validate_email(email):
-    return re.match(email_regex, email)
+    return email_pattern.match(email)
 
 
 def validate_username(username):
@@ -23,18 +38,69 @@ def validate_username(username):
 
 def validate_password(password):
     if len(password) < 6 or len(password) > 18:
-        return False, "کلمه عبور باید حداقل 6 و حداکثر 18 حرف باشد"
+        return False, PASSWORD_LENGTH_ERROR
 
-    # Check for at least one uppercase letter
-    if not re.search(r"[A-Z]", password):
-        return False, "کلمه عبور باید حداقل شامل یک حرف بزرگ باشد"
+    # Single pass over the characters instead of one regex search per rule.
+    has_upper = has_lower = has_digit = False
+    for char in password:
+        if "A" <= char <= "Z":
+            has_upper = True
+        elif "a" <= char <= "z":
+            has_lower = True
+        elif char.isdecimal():
+            # Same set as the regex \d: Persian and Arabic digits count too.
+            has_digit = True
 
-    # Check for at least one lowercase letter
-    if not re.search(r"[a-z]", password):
-        return False, "کلمه عبور باید حداقل شامل یک حرف کوچک باشد"
-
-    # Check for at least one digit
-    if not re.search(r"\d", password):
-        return False, "کلمه عبور باید شامل عدد باشد"
+    if not has_upper:
+        return False, PASSWORD_UPPERCASE_ERROR
+    if not has_lower:
+        return False, PASSWORD_LOWERCASE_ERROR
+    if not has_digit:
+        return False, PASSWORD_DIGIT_ERROR
 
     return True, "معتبر"
+
+
+def canonicalize_phone(phone):
+    """
+    Return the E.164 form (+989xxxxxxxxx) of an Iranian mobile number, or None.
+    """
+    if not phone:
+        return None
+    match = phone_pattern.match(phone.strip().translate(phone_cleanup_table))
+    return f"+98{match.group(1)}" if match else None
+
+
+def canonicalize_email(email):
+    if not email:
+        return None
+    email = email.strip().lower()
+    return email if email_pattern.match(email) else None
+
+
+def canonicalize_username(username):
+    """
+    Return ``(kind, value)`` where kind is "phone" or "email", or ``(None, None)``.
+    """
+    phone = canonicalize_phone(username)
+    if phone:
+        return "phone", phone
+    email = canonicalize_email(username)
+    if email:
+        return "email", email
+    return None, None
+
+
+def validate_many(usernames):
+    """
+    Batch form of ``canonicalize_username`` for bulk imports. Returns the
+    canonical values grouped by kind plus the inputs that were rejected.
+    """
+    result = {"phone": [], "email": [], "invalid": []}
+    for username in usernames:
+        kind, value = canonicalize_username(username)
+        if kind is None:
+            result["invalid"].append(username)
+        else:
+            result[kind].append(value)
+    return result
@@ -2,7 +2,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
-import dj_database_url
+from config.libs.db.connections import build_database_config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -49,6 +49,7 @@ EXTERNAL_APPS = [
 
 INTERNAL_APPS = [
     "config.api",
+    "config.libs.messaging_services",
 
 ]
 INSTALLED_APPS = DJANGO_APPS + EXTERNAL_APPS + INTERNAL_APPS
@@ -66,6 +67,22 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "config.libs.db": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
+}
+
 if DEBUG:
     INSTALLED_APPS = [
                          "drf_spectacular",
@@ -88,6 +105,9 @@ if DEBUG:
             "django.db.backends": {
                 "level": "DEBUG",
             },
+            "config.libs.db": {
+                "level": "INFO",
+            },
         },
         "root": {
             "handlers": ["console"],
@@ -124,7 +144,15 @@ ASGI_APPLICATION = "config.asgi.application"
 DB_URL = os.environ.get("DB_URL")
 if DB_URL:
     DATABASES = {
-        'default': dj_database_url.config(default=os.environ.get("DB_URL"))
+        'default': build_database_config(
+            DB_URL,
+            conn_max_age=int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+            health_checks=os.environ.get("DB_CONN_HEALTH_CHECKS", "True") == "True",
+            pool=os.environ.get("DB_POOL") == "True",
+            pool_min_size=int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            pool_max_size=int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+            pgbouncer=os.environ.get("DB_PGBOUNCER") == "True",
+        )
     }
 else:
     DATABASES = {
@@ -186,17 +214,21 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "config.api.renderers.BaseResponseJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "config.api.authentication.CachedJWTAuthentication"
     ],
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_PAGINATION_CLASS": "config.api.response.PaginationApiResponse",
     "PAGE_SIZE": 20,
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.ScopedRateThrottle',
+        'config.api.throttling.SlidingWindowScopedRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         '1perminute': '1/min',
@@ -208,6 +240,15 @@ REST_FRAMEWORK = {
         '2perhours': '2/hours',
     }
 }
+SOFT_DELETE_RETENTION_DAYS = int(os.environ.get("SOFT_DELETE_RETENTION_DAYS", 30))
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.environ.get("PAGINATION_COUNT_CACHE_TIMEOUT", 60))
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("PAGINATION_COUNT_ESTIMATE_THRESHOLD", 100_000)
+)
+AUTH_USER_CACHE_TIMEOUT = 60
+JWT_BLACKLIST_REFRESH_INTERVAL = 30
+JWT_BLACKLIST_REBUILD_INTERVAL = 60 * 60
+JWT_BLACKLIST_REFRESH_OVERLAP = 60
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=90),
@@ -233,20 +274,44 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
-    "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    "TOKEN_OBTAIN_SERIALIZER": "config.api.tokens.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "config.api.tokens.TokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework_simplejwt.serializers.TokenVerifySerializer",
-    "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "config.api.tokens.TokenBlacklistSerializer",
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
-# CACHES = {
-#     "default": {
-#         "BACKEND": "django_redis.cache.RedisCache",
-#         "LOCATION": os.environ.get("REDIS_URL"),
-#         "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
-#     },
-# }
+REDIS_URL = os.environ.get("REDIS_URL")
+CACHES = {
+    "default": {
+        "BACKEND": "config.libs.cache.backends.TwoTierCache",
+        "LOCATION": "shared",
+        "OPTIONS": {
+            "LOCAL_TIMEOUT": int(os.environ.get("CACHE_LOCAL_TIMEOUT", 5)),
+            "LOCAL_MAX_ENTRIES": int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", 1000)),
+            # Counters, throttle history, tag generations and cached users are
+            # invalidated across processes and must never be served from a stale
+            # local copy.
+            "LOCAL_EXCLUDE_PREFIXES": [
+                "throttle_",
+                "otp:",
+                "generation:",
+                "auth:user:",
+            ],
+        },
+    },
+    "shared": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+        if REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "shared",
+        }
+    ),
+}
 # BROKER_URL = os.environ.get("CELERY_BROKER_URL")
 # CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND")
 # CELERY_ACCEPT_CONTENT = ["application/json"]
@@ -261,4 +326,22 @@ EMAIL_PORT = 587
 EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
 EMAIL_HOST_FROM_ADDRESS = os.environ.get("EMAIL_HOST_FROM_ADDRESS")
-EMAIL_USE_TLS = True
\ No newline at end of file
+EMAIL_USE_TLS = True
+EMAIL_RATE_LIMIT = float(os.environ.get("EMAIL_RATE_LIMIT", 0)) or None
+
+FARAZ_SMS_API = os.environ.get("FARAZ_SMS_API")
+FARAZ_SMS_URL = os.environ.get(
+    "FARAZ_SMS_URL", "https://api2.ippanel.com/api/v1/sms/pattern/normal/send"
+)
+SMS_CONNECT_TIMEOUT = float(os.environ.get("SMS_CONNECT_TIMEOUT", 3.05))
+SMS_READ_TIMEOUT = float(os.environ.get("SMS_READ_TIMEOUT", 10))
+SMS_MAX_RETRIES = int(os.environ.get("SMS_MAX_RETRIES", 3))
+
+OUTBOX_LEASE_SECONDS = int(os.environ.get("OUTBOX_LEASE_SECONDS", 300))
+
+OTP_LENGTH = 6
+OTP_TTL = 120
+OTP_RESEND_INTERVAL = 60
+OTP_MAX_RESENDS = 5
+OTP_RESEND_WINDOW = 60 * 60
+OTP_MAX_ATTEMPTS = 5